@@ -0,0 +1,252 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import argparse as ap
+import hashlib as hl
+import itertools as it
+import json
+import multiprocessing as mp
+import os
+import structure as st
+
+# Batch Figures, run from the command line E.g.
+# python batch.py --kinds plot,group --orders 1-4 --colormaps RdBu_r,viridis
+# Renders every combination of order, colormap (plot) and layers (group) with
+# the Agg backend across a pool of worker processes, and skips figures whose
+# options and plotting sources are unchanged since they were last written
+
+# The plotting libraries and multiplication tables are loaded once in the
+# parent before the pool is started, forked workers share them and spawned
+# workers load them on startup
+
+manifest = "batch.json"
+sources = ("plot.py", "group.py", "definitions.py", "formatting.py", "structure.py", "hypercomplex.py")
+
+def orders(text):
+
+	# Comma separated orders and ranges, E.g. 1,3-5 -> [1, 3, 4, 5]
+
+	result = []
+
+	for part in text.split(","):
+
+		if "-" in part:
+
+			first, last = part.split("-")
+			result.extend(range(int(first), int(last) + 1))
+
+		elif part:
+
+			result.append(int(part))
+
+	return result
+
+def digest():
+
+	# Hash of the plotting sources, so figures are redrawn when the code changes
+
+	folder = os.path.dirname(os.path.abspath(__file__))
+	hash = hl.sha256()
+
+	for name in sources:
+
+		with open(os.path.join(folder, name), "rb") as file:
+
+			hash.update(file.read())
+
+	return hash.hexdigest()
+
+def jobs(**options):
+
+	def option(name, default, **options):
+
+		if name in options and options[name] != None:
+
+			return options[name]
+
+		return default
+
+	kinds = option("kinds", "plot,group", **options).split(",")
+	numbers = orders(option("orders", "1-4", **options))
+	colormaps = option("colormaps", "RdBu_r", **options).split(",")
+	layers = option("layers", "", **options).split(";")
+	directory = option("directory", "figures", **options)
+	filetype = option("filetype", "png", **options)
+	results = []
+
+	for kind, order in it.product(kinds, numbers):
+
+		if kind == "plot":
+
+			for colormap in colormaps:
+
+				suffix = "" if colormap == "RdBu_r" else F"_{colormap}"
+				name = F"P{order}{suffix}.{filetype}"
+				results.append((kind, {"order": order, "colormap": colormap, "filename": os.path.join(directory, name)}))
+
+		elif kind == "group":
+
+			for layer in layers:
+
+				suffix = "" if not layer else "_" + layer.replace(",", "_")
+				name = F"G{order}{suffix}.{filetype}"
+				results.append((kind, {"order": order, "layers": layer or False, "filename": os.path.join(directory, name)}))
+
+		else:
+
+			raise ValueError(F"Unknown figure kind: {kind}")
+
+	for kind, values in results:
+
+		values.update({"filetype": filetype, "save": True, "show": False})
+
+	return results
+
+def key(kind, values, version):
+
+	return hl.sha256(json.dumps([kind, values, version], sort_keys=True).encode()).hexdigest()
+
+def preload(numbers):
+
+	# The plotting libraries and tables, loaded in the parent so forked
+	# workers inherit them, without changing the parent's backend
+
+	import group
+	import matplotlib.pyplot
+	import networkx
+	import plot
+	import seaborn
+
+	for order in numbers:
+
+		st.table(order)
+
+def initialize(numbers):
+
+	# Worker setup, the headless backend then anything not inherited
+
+	import matplotlib as mpl
+
+	mpl.use("Agg")
+
+	preload(numbers)
+
+def render(kind, values):
+
+	import matplotlib.pyplot as plt
+
+	if kind == "plot":
+
+		from plot import plot as function
+
+	else:
+
+		from group import group as function
+
+	try:
+
+		function(**values)
+
+	finally:
+
+		plt.close("all")
+
+	return values["filename"]
+
+def batch(**options):
+
+	def option(name, default, **options):
+
+		if name in options and options[name] != None:
+
+			return options[name]
+
+		return default
+
+	directory = option("directory", "figures", **options)
+	workers = option("workers", os.cpu_count(), **options)
+	force = option("force", False, **options)
+	version = digest()
+	path = os.path.join(directory, manifest)
+	pending = []
+	skipped = []
+
+	os.makedirs(directory, exist_ok=True)
+
+	try:
+
+		with open(path) as file:
+
+			written = json.load(file)
+
+	except (OSError, ValueError):
+
+		written = {}
+
+	for kind, values in jobs(**options):
+
+		hash = key(kind, values, version)
+
+		if not force and written.get(values["filename"]) == hash and os.path.exists(values["filename"]):
+
+			skipped.append(values["filename"])
+
+		else:
+
+			pending.append((kind, values, hash))
+
+	numbers = sorted({values["order"] for _, values, _ in pending})
+
+	preload(numbers)
+
+	try:
+
+		if pending:
+
+			# Fork where available so the workers inherit the parent's tables
+
+			methods = mp.get_all_start_methods()
+			context = mp.get_context("fork" if "fork" in methods else None)
+
+			with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=initialize, initargs=(numbers,)) as pool:
+
+				futures = [(pool.submit(render, kind, values), hash) for kind, values, hash in pending]
+
+				for future, hash in futures:
+
+					filename = future.result()
+					written[filename] = hash
+					print(F"Rendered {filename}")
+
+		for filename in skipped:
+
+			print(F"Skipped {filename}")
+
+	finally:
+
+		# The manifest is written even when a figure fails, keeping the finished ones
+
+		with open(path + ".tmp", "w") as file:
+
+			json.dump(written, file, indent=1, sort_keys=True)
+
+		os.replace(path + ".tmp", path)
+
+	return [values["filename"] for _, values, _ in pending], skipped
+
+if __name__ == "__main__":
+
+	parser = ap.ArgumentParser()
+
+	parser.add_argument("-k", "--kinds", type=str, default="plot,group")
+	parser.add_argument("-o", "--orders", type=str, default="1-4")
+	parser.add_argument("-c", "--colormaps", type=str, default="RdBu_r")
+	parser.add_argument("-l", "--layers", type=str, default="")
+	parser.add_argument("-d", "--directory", type=str, default="figures")
+	parser.add_argument("-t", "--filetype", type=str, default="png")
+	parser.add_argument("-w", "--workers", type=int, default=os.cpu_count())
+
+	parser.add_argument("--force", action="store_true", default=False)
+
+	args, urgs = parser.parse_known_args()
+
+	batch(**vars(args))
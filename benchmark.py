@@ -0,0 +1,190 @@
+from hypercomplex import cayley_dickson_algebra, BaseNumber
+from dunders import dunders, math
+
+import argparse as ap
+import numpy as np
+import timeit as ti
+import tracemalloc as tm
+
+# Benchmarks, run from the command line E.g. python benchmark.py --mode memory
+# memory    : bytes per number for each order and storage
+# speed     : nanoseconds per Real operation for the fast and slow dunders
+# precision : relative error of multiply and inverse for float32 and float64
+
+names = ["Real", "Complex", "Quaternion", "Octonion", "Sedenion", "Pathion", "Chingon", "Routon", "Voudon"]
+
+def memory(**options):
+
+	# Bytes per number for each order, measured with tracemalloc over a list of
+	# count numbers (array and tree storage), and per row of a HyperComplexArray
+
+	def option(name, default, **options):
+
+		if name in options:
+
+			return options[name]
+
+		return default
+
+	def measure(function):
+
+		tm.start()
+		values = function()
+		size, _ = tm.get_traced_memory()
+		tm.stop()
+
+		del values
+
+		return size / count
+
+	count = option("count", 10000, **options)
+	orders = option("orders", 8, **options)
+	results = []
+
+	for order in range(orders + 1):
+
+		row = [names[order]]
+
+		for storage in ("array", "tree"):
+
+			numbers = cayley_dickson_algebra(order, storage=storage)
+			coefficients = tuple(float(x + 1) for x in range(numbers.dimensions))
+
+			row.append(measure(lambda: [numbers(*coefficients) for _ in range(count)]))
+
+		if order == 0:
+
+			row.append(np.nan)
+
+		else:
+
+			numbers = cayley_dickson_algebra(order)
+			row.append(measure(lambda: numbers.Array(np.ones((count, numbers.dimensions)))))
+
+		results.append(row)
+
+	print(F"{'Bytes Per Number':<16} {'Array':>12} {'Tree':>12} {'HyperComplexArray':>18}")
+
+	for name, array, tree, batched in results:
+
+		print(F"{name:<16} {array:>12.1f} {tree:>12.1f} {batched:>18.1f}")
+
+	return results
+
+def speed(**options):
+
+	# Nanoseconds per Real operation, comparing the generated dunders (fast)
+	# with the generic wrappers (slow), and plain floats as the lower bound
+
+	def option(name, default, **options):
+
+		if name in options:
+
+			return options[name]
+
+		return default
+
+	@dunders(base=float, names=math, fast=False)
+	class Slow(BaseNumber, float):
+
+		__slots__ = ()
+
+	count = option("count", 10000, **options)
+	Fast = cayley_dickson_algebra(0)
+	operations = ["x + y", "x - y", "x * y", "x / y", "x ** 2", "-x", "2 * x"]
+	results = []
+
+	for operation in operations:
+
+		row = [operation]
+
+		for numbers in (Fast, Slow, float):
+
+			namespace = {"x": numbers(1.5), "y": numbers(2.5)}
+			time = min(ti.repeat(operation, globals=namespace, number=count, repeat=5))
+			row.append(time / count * 1e9)
+
+		results.append(row)
+
+	print(F"{'Nanoseconds':<16} {'Fast':>12} {'Slow':>12} {'Float':>12}")
+
+	for operation, fast, slow, plain in results:
+
+		print(F"{operation:<16} {fast:>12.1f} {slow:>12.1f} {plain:>12.1f}")
+
+	return results
+
+def precision(**options):
+
+	# Largest relative error of multiplication and inverse for each order and
+	# dtype, against the same (rounded) inputs computed in np.longdouble, with
+	# dimensions * eps as the expected bound from the sum in each coefficient
+
+	def option(name, default, **options):
+
+		if name in options:
+
+			return options[name]
+
+		return default
+
+	def relative(value, exact):
+
+		value = np.asarray(value, dtype=np.longdouble)
+		error = np.sqrt(np.sum((value - exact) ** 2, axis=-1))
+		size = np.sqrt(np.sum(exact ** 2, axis=-1))
+
+		return float(np.max(error / size))
+
+	count = option("count", 10000, **options)
+	orders = option("orders", 8, **options)
+	generator = np.random.default_rng(0)
+	results = []
+
+	for order in range(1, orders + 1):
+
+		reference = cayley_dickson_algebra(order, dtype=np.longdouble).Array
+		x = generator.standard_normal((count, 2 ** order))
+		y = generator.standard_normal((count, 2 ** order))
+
+		for dtype in (np.float32, np.float64):
+
+			numbers = cayley_dickson_algebra(order, dtype=dtype).Array
+			a, b = numbers(x), numbers(y)
+			exact = reference(a.array), reference(b.array)
+
+			product = relative((a * b).array, (exact[0] * exact[1]).array)
+			inverse = relative(a.inverse().array, exact[0].inverse().array)
+			bound = numbers.dimensions * float(np.finfo(dtype).eps)
+
+			results.append([names[order], np.dtype(dtype).name, product, inverse, bound])
+
+	print(F"{'Relative Error':<16} {'Type':>12} {'Multiply':>12} {'Inverse':>12} {'Bound':>12}")
+
+	for name, dtype, product, inverse, bound in results:
+
+		print(F"{name:<16} {dtype:>12} {product:>12.3e} {inverse:>12.3e} {bound:>12.3e}")
+
+	return results
+
+if __name__ == "__main__":
+
+	parser = ap.ArgumentParser()
+
+	parser.add_argument("-m", "--mode", type=str, default="memory")
+	parser.add_argument("-c", "--count", type=int, default=10000)
+	parser.add_argument("-o", "--orders", type=int, default=8)
+
+	args, urgs = parser.parse_known_args()
+
+	if args.mode == "memory":
+
+		memory(**vars(args))
+
+	elif args.mode == "speed":
+
+		speed(**vars(args))
+
+	elif args.mode == "precision":
+
+		precision(**vars(args))
@@ -0,0 +1,188 @@
+from collections import OrderedDict, namedtuple
+from functools import wraps
+
+import weakref as wr
+
+# Memoization Policies
+# "off"   never caches, the method is called directly
+# "lru"   keeps the maxsize most recently used results
+# "weak"  keeps results only while the left hand operand is alive
+# "basis" keeps results only when every operand is a basis element (+/- e[i])
+
+# Cache keys are snapshots of the operand coefficients, so cached entries never
+# hold references to the operands themselves, and operands which cannot be
+# hashed (such as HyperComplexArray) always bypass the cache. Results are kept
+# and handed out as copies, as array stored values can be changed in place.
+
+policies = ("off", "lru", "weak", "basis")
+enabled = True
+
+CacheInfo = namedtuple("CacheInfo", "hits misses evictions maxsize currsize policy")
+
+def enable():
+
+	global enabled
+
+	enabled = True
+
+def disable():
+
+	global enabled
+
+	enabled = False
+
+def key(value):
+
+	if hasattr(value, "coefficients"):
+
+		return value.coefficients()
+
+	if type(value).__hash__ is None:
+
+		raise TypeError(F"Unhashable type {type(value).__name__}.")
+
+	return value
+
+def copy(value):
+
+	return value.copy() if hasattr(value, "copy") else value
+
+def isbasis(value):
+
+	if type(value).__hash__ is None:
+
+		return False
+
+	coefficients = value.coefficients() if hasattr(value, "coefficients") else (value,)
+	found = [x for x in coefficients if x]
+
+	return len(found) == 1 and abs(found[0]) == 1
+
+class Memo:
+
+	def __init__(self, policy="lru", maxsize=128):
+
+		self.configure(policy, maxsize)
+
+	def configure(self, policy="lru", maxsize=128):
+
+		if policy not in policies:
+
+			raise ValueError(F"Unknown cache policy {policy}, expecting one of {', '.join(policies)}.")
+
+		self.policy = policy
+		self.maxsize = maxsize
+		self.clear()
+
+	def clear(self):
+
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
+		self.results = OrderedDict()
+		self.owners = {}
+
+	def info(self):
+
+		size = len(self.results) + sum(len(x[1]) for x in self.owners.values())
+
+		return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, size, self.policy)
+
+	def release(self, owner):
+
+		# Weak policy callback, the left hand operand has been garbage collected
+
+		entry = self.owners.pop(owner, None)
+
+		if entry is not None:
+
+			self.evictions += len(entry[1])
+
+	def store(self, owner):
+
+		if self.policy != "weak":
+
+			return self.results
+
+		index = id(owner)
+
+		if index not in self.owners:
+
+			self.owners[index] = (wr.ref(owner, lambda _: self.release(index)), {})
+
+		return self.owners[index][1]
+
+	def __call__(self, method, owner, *args):
+
+		if self.policy == "basis" and not all(map(isbasis, (owner,) + args)):
+
+			return method(owner, *args)
+
+		try:
+
+			index = (key(owner),) + tuple(map(key, args))
+			results = self.store(owner)
+
+		except TypeError:
+
+			return method(owner, *args)
+
+		if index in results:
+
+			self.hits += 1
+
+			if self.policy == "lru":
+
+				results.move_to_end(index)
+
+			return copy(results[index])
+
+		self.misses += 1
+		result = method(owner, *args)
+		results[index] = copy(result)
+
+		if self.policy == "lru" and self.maxsize is not None and len(results) > self.maxsize:
+
+			results.popitem(last=False)
+			self.evictions += 1
+
+		return result
+
+def memoize(method):
+
+	memo = Memo()
+
+	@wraps(method)
+	def wrapper(self, *args):
+
+		if not enabled or memo.policy == "off":
+
+			return method(self, *args)
+
+		return memo(method, self, *args)
+
+	wrapper.memo = memo
+	wrapper.cache_info = memo.info
+	wrapper.cache_clear = memo.clear
+
+	return wrapper
+
+# Class Level Configuration
+# configure(cls, policy, maxsize) changes the policy of every memoized method on cls
+# statistics(cls)                  returns the CacheInfo of every memoized method on cls
+
+def memoized(cls):
+
+	return {name: value for name, value in vars(cls).items() if hasattr(value, "memo")}
+
+def configure(cls, policy="lru", maxsize=128):
+
+	for method in memoized(cls).values():
+
+		method.memo.configure(policy, maxsize)
+
+	return statistics(cls)
+
+def statistics(cls):
+
+	return {name: method.cache_info() for name, method in memoized(cls).items()}
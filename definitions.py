@@ -1,3 +1,6 @@
+import colorsys as cs
+import numpy as np
+
 # Colors (Fixed Color Graph Indices)
 # Returns (red, green, blue, opacity)
 
@@ -30,11 +33,22 @@ def colormap(order, size):
 
 	return colors
 
+def palette(id):
+
+	# Beyond the fixed colors, hues step by the golden ratio so neighbouring
+	# indices stay distinct however many are needed, with the lightness
+	# alternating between two levels, returned as a hex string like the above
+
+	hue = (id * 0.618033988749895) % 1
+	red, green, blue = cs.hls_to_rgb(hue, 0.5 if id % 2 else 0.65, 1)
+
+	return "".join("{:02X}".format(round(x * 0xFF)) for x in (red, green, blue))
+
 def color(order, id):
 
 	negative = True if id >= 2**order else False
 	id -= 2**order if negative else 0
-	color = colors[id]
+	color = colors[id] if id < len(colors) else palette(id)
 	out = [0, 0, 0, 1]
 
 	for i in range(3):
@@ -69,6 +83,24 @@ locations = [
 	[4, 9], [3, 11], [-3, 11], [-4, 9],				# O, V, W, X Pathion
 ]
 
+def ring(id, radius=12, spacing=2.5):
+
+	# Beyond the fixed locations, placed on half rings left of the center (the
+	# negatives mirror them to the right), each ring further out holding as
+	# many nodes as fit at the same spacing
+
+	capacity = int(np.pi * radius / spacing)
+
+	while id >= capacity:
+
+		id -= capacity
+		radius += spacing
+		capacity = int(np.pi * radius / spacing)
+
+	angle = np.pi / 2 + np.pi * (id + 0.5) / capacity
+
+	return [radius * np.cos(angle), radius * np.sin(angle)]
+
 def locationmap(order, size):
 
 	locations = {}
@@ -83,7 +115,14 @@ def location(order, id):
 
 	negative = True if id >= 2**order else False
 	id -= 2**order if negative else 0
-	location = locations[id]
+
+	if id < len(locations):
+
+		location = list(locations[id])
+
+	else:
+
+		location = ring(id - len(locations))
 
 	for i in range(2):
 
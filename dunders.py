@@ -61,7 +61,52 @@ math = math_unitary + math_binary + math_reverse + math_inplace
 
 everything = convert + compare + bitwise + objects + math
 
-def dunders(base=None, names=everything, force=False):
+# Fast Dunder Templates
+# The base method is resolved once when the class is decorated and called
+# directly on self (an instance of a base subclass), rather than converting
+# self to the base type and looking the method up on every call
+
+template = """
+def {name}(self{parameters}):
+
+	result = method(self{arguments})
+
+	if result is NotImplemented:
+
+		return NotImplemented
+
+	return {result}
+"""
+
+parameters = {
+	**{F"__{name}__": ("", "") for name in "abs ceil floor neg pos trunc invert".split()},
+	**{F"__{name}__": (", other", ", other") for name in math_binary + math_reverse + math_inplace},
+	**{F"__{name}__": (", other, modulo=None", ", other, modulo") for name in "pow rpow".split()},
+}
+
+tuples = ("__divmod__", "__rdivmod__")
+
+def generate(cls, base, name):
+
+	method = getattr(base, name)
+	parameter, argument = parameters.get(name, (", *args, **kwargs", ", *args, **kwargs"))
+	result = "tuple(map(cls, result))" if name in tuples else "cls(result)"
+	source = template.format(name=name, parameters=parameter, arguments=argument, result=result)
+	namespace = {"method": method, "cls": cls}
+
+	exec(source, namespace)
+
+	dunder = namespace[name]
+	dunder.__qualname__ = F"{cls.__qualname__}.{name}"
+
+	return dunder
+
+def dunders(base=None, names=everything, force=False, fast=True):
+
+	# fast=True  installs generated methods calling the base method directly,
+	#            names the base type does not implement are left out, so
+	#            Python falls back as normal (E.g. x += y uses __add__)
+	# fast=False installs generic wrappers converting self to the base type
 
 	names = tuple(F"__{name}__" for name in names)
 
@@ -95,9 +140,13 @@ def dunders(base=None, names=everything, force=False):
 
 			cls_has_dunder = hasattr(cls, name) and getattr(cls, name) is not getattr(base, name)
 
+			if fast and not hasattr(base, name):
+
+				continue
+
 			if force or not cls_has_dunder:
 
-				setattr(cls, name, add_dunder(name))
+				setattr(cls, name, generate(cls, base, name) if fast else add_dunder(name))
 
 		return cls
 
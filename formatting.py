@@ -0,0 +1,128 @@
+from functools import lru_cache
+
+import numpy as np
+
+# Formatters
+# The display options are parsed once into a Formatter, which then renders
+# coefficients, products and whole multiplication tables from precomputed
+# labels, formatter(cls, **options) caches one per algebra and option set,
+# and each formatter caches the tables it has rendered
+
+options = {
+	"element": "e",
+	"indices": "1ijkLIJKmpqrMPQRnstuNSTUovwxOVWX",
+	"translate": True,
+	"showplus": False,
+}
+
+class Formatter:
+
+	def __init__(self, dimensions, element="e", indices="1ijkLIJKmpqrMPQRnstuNSTUovwxOVWX", translate=True, showplus=False):
+
+		indices = list(indices)
+		enabled = translate and dimensions <= len(indices)
+
+		self.dimensions = dimensions
+		self.plus = "+" if showplus else ""
+		self.names = [indices[i] if enabled else F"{element}{i}" for i in range(dimensions)]
+		self.positives = np.array([self.plus + x for x in self.names], dtype=object)
+		self.negatives = np.array(["-" + x for x in self.names], dtype=object)
+		self.tables = {}
+
+	def label(self, value, index):
+
+		# Coefficient value of basis element index, E.g. -2j, e5 or 1.5
+
+		name = self.names[index]
+		sign = "-" if value < 0 else self.plus
+		value = "" if abs(value) == 1 else "{:g}".format(abs(value))
+		name = "" if name == "1" and value else name
+
+		return F"{sign}{value}{name}"
+
+	def labels(self, values, indexes):
+
+		# Labels of nonzero values, zero values are left as 0
+
+		return [self.label(value, index) if value else 0 for value, index in zip(values, indexes)]
+
+	def indexed(self, values, indexes):
+
+		# One based index of each nonzero value, negative for negative values
+
+		values = np.asarray(values)
+		indexes = np.asarray(indexes) + 1
+
+		return np.where(values == 0, 0, np.where(values < 0, -indexes, indexes)).tolist()
+
+	def join(self, values):
+
+		# Sum of the labelled coefficients, E.g. 1 + 2i - 3j + 0
+
+		result = ""
+
+		for index, value in enumerate(values):
+
+			value = str(self.label(value, index) if value else 0)
+
+			if index:
+
+				value = " - " + value[1:] if value[:1] == "-" else " + " + value
+
+			result += value
+
+		return result
+
+	def table(self, index, sign, asindex=False):
+
+		# Rendered multiplication table e[i] * e[j] = sign[i, j] * e[index[i, j]],
+		# as one based signed indexes or as labels, cached and returned as copies
+
+		key = (len(index), asindex)
+
+		if key not in self.tables:
+
+			if asindex:
+
+				cells = (index + 1) * sign
+
+			else:
+
+				cells = np.where(sign < 0, self.negatives[index], self.positives[index])
+
+			self.tables[key] = cells.tolist()
+
+		return [row[:] for row in self.tables[key]]
+
+	def grid(self, index, sign, asindex=False):
+
+		key = (len(index), asindex, "grid")
+
+		if key not in self.tables:
+
+			self.tables[key] = self.display(self.table(index, sign, asindex))
+
+		return self.tables[key]
+
+	def display(self, result):
+
+		# Right aligned text grid, the first column is trimmed to its own width
+
+		result = [list(map(str, row)) for row in result]
+		length = max(len(cell) for row in result for cell in row)
+		offset = length - max(len(row[0]) for row in result)
+		rows = [" ".join(cell.rjust(length) for cell in row)[offset:] for row in result]
+
+		return "\n".join(rows)
+
+@lru_cache(maxsize=None)
+def cached(cls, element, indices, translate, showplus):
+
+	return Formatter(cls.dimensions, element, indices, translate, showplus)
+
+def formatter(cls, **args):
+
+	values = {name: args.get(name, default) for name, default in options.items()}
+	values["indices"] = tuple(values["indices"])
+
+	return cached(cls, **values)
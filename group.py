@@ -1,15 +1,18 @@
-from hypercomplex import Order, Names
+from hypercomplex import cayley_dickson_algebra, Order, Names
 
 import argparse as ap
 import definitions as df
-import matplotlib.pyplot as plt
-import itertools as it
-import networkx as nx
 import numpy as np
 import warnings as wn
 
 def group(**options):
 
+	# Plotting libraries are only imported when a graph is drawn
+
+	import matplotlib as mpl
+	import matplotlib.pyplot as plt
+	import networkx as nx
+
 	def option(name, default, **options):
 
 		if name in options:
@@ -18,58 +21,158 @@ def group(**options):
 
 		return default
 
-	def identity():
+	def cayley():
 
-		rg  = range(0, self.dimensions)
-		id  = [[+1 if i == j else 0 for j in rg] for i in rg]
-		id += [[-1 if i == j else 0 for j in rg] for i in rg]
+		# Cayley table of the signed basis elements +e[i] (node i) and -e[i]
+		# (node i + dimensions), taken from the cached multiplication table
 
-		for i in range(0, self.dimensions * 2):
+		index, sign = self.table()
 
-			id[i] = self.__class__(tuple(id[i]))
+		signs = np.repeat([1, -1], self.dimensions)
+		index = np.tile(index, (2, 2))
+		sign = np.tile(sign, (2, 2)) * signs[:, None] * signs[None, :]
 
-		return id
+		return index + self.dimensions * (sign < 0)
 
 	def edges(index):
 
-		found = np.zeros(groups.shape, dtype=int)
+		# Target of every node in one layer, node a connects to a * e[index]
+
+		return groups[:, index]
+
+	def find(node):
+
+		while parents[node] != node:
+
+			parents[node] = parents[parents[node]]
+			node = parents[node]
 
-		for id in range(size):
+		return node
 
-			found[id, groups[id, index]] = 1
+	def connect(connection):
 
-		return found
+		# Adds the edges of one layer to the union-find forest,
+		# returning the number of components merged
 
-	def indexer(input):
+		merged = 0
 
-		if not input:
+		for a, b in enumerate(connection):
 
-			return 0
+			a, b = find(a), find(b)
 
-		coefficients = input.coefficients()
-		id, val = next(((id, val) for id, val in enumerate(coefficients) if val))
-		id += input.dimensions if val < 0 else 0
+			if a != b:
 
-		return id
+				parents[a] = b
+				merged += 1
+
+		return merged
 
 	def add_node(graph, a, color, label):
 
 		graph.add_node(a, label=label, color=color)
 
-	def add_edge(graph, a, b, color):
+	def arrows(sources, targets, radius):
+
+		# Curved arrows matching arc3 connections, computed for all edges at once
+		# in display coordinates: a quadratic curve between the node centers,
+		# trimmed to the node circles, with a triangular head at the end
+
+		transform = ax.transData
+		scale = fig.dpi / 72
+
+		start = transform.transform(points[sources])
+		end = transform.transform(points[targets])
+
+		delta = end - start
+		chord = np.maximum(np.hypot(delta[:, 0], delta[:, 1]), 1e-9)
+		control = (start + end) / 2 + radius[:, None] * np.stack([delta[:, 1], -delta[:, 0]], axis=1)
+
+		def blossom(u, v):
+
+			return ((1 - u) * (1 - v))[:, None] * start + ((1 - u) * v + u * (1 - v))[:, None] * control + (u * v)[:, None] * end
+
+		trim = np.minimum(np.sqrt(node_size) / 2 * scale / chord, 0.45)
+		first, middle, last = blossom(trim, trim), blossom(trim, 1 - trim), blossom(1 - trim, 1 - trim)
+
+		direction = last - middle
+		direction /= np.maximum(np.hypot(direction[:, 0], direction[:, 1]), 1e-9)[:, None]
+		normal = np.stack([-direction[:, 1], direction[:, 0]], axis=1)
+		length = 0.4 * arrowsize * scale
+		width = 0.2 * arrowsize * scale
+
+		base = last - length * direction
+
+		curves = np.stack([first, middle, base], axis=1)
+		heads = np.stack([last, base + width * normal, base - width * normal, last], axis=1)
+
+		return curves, heads
+
+	def data(vertices):
+
+		inverse = ax.transData.inverted()
+
+		return inverse.transform(vertices.reshape(-1, 2)).reshape(vertices.shape)
+
+	def raster(curves, heads):
+
+		# Dense graphs are drawn straight into a figure sized image, as stroking
+		# each curve costs the same however they are batched, sampling every
+		# curve about once per pixel and filling the heads from a triangular
+		# grid. Pixels record the last layer drawn over them, which is colored
+		# at the end, so later layers cover earlier ones
+
+		width, height = int(fig.bbox.width), int(fig.bbox.height)
+		drawn = np.full(height * width, -1, dtype=np.int32)
+		grid = int(np.ceil(0.4 * arrowsize * fig.dpi / 72)) + 1
+		u, v = np.meshgrid(np.linspace(0, 1, grid), np.linspace(0, 1, grid))
+		inside = u + v <= 1
+		u, v = u[inside].astype(np.float32), v[inside].astype(np.float32)
+		curves = curves.astype(np.float32)
+		heads = heads.astype(np.float32)
 
-		rad_inc = 0.05
-		rad_min = 0.05
+		def sample(axis):
 
-		if (a, b) in graph.edges:
+			# Pixel coordinates along one axis of the curves then the heads
 
-			rad_max = max(x[2]["radius"] for x in graph.edges(data=True) if sorted(x[:2]) == sorted([a,b]))
+			curve = np.repeat(first[:, axis], counts) + t * (np.repeat(b[:, axis], counts) + t * np.repeat(a[:, axis], counts))
 
-		else:
+			return np.concatenate([curve, fill[:, axis]]).astype(np.intp)
 
-			rad_max = rad_min
+		for id in range(len(colors)):
 
-		graph.add_edge(a, b, radius=rad_max+rad_inc, color=color)
+			layer = slice(id * size, (id + 1) * size)
+			first, middle, last = curves[layer, 0], curves[layer, 1], curves[layer, 2]
+
+			# Quadratic curves in Horner form, first + t * (b + t * a)
+
+			b = 2 * (middle - first)
+			a = first - 2 * middle + last
+
+			length = np.hypot(*(middle - first).T) + np.hypot(*(last - middle).T)
+			counts = np.ceil(length).astype(np.intp) + 2
+			t = np.arange(counts.sum(), dtype=np.float32) - np.repeat(np.cumsum(counts) - counts, counts)
+			t /= np.repeat(counts - 1, counts)
+
+			tip, left, right = heads[layer, 0, None], heads[layer, 1, None], heads[layer, 2, None]
+			fill = (tip + u[None, :, None] * (left - tip) + v[None, :, None] * (right - tip)).reshape(-1, 2)
+
+			x, y = sample(0), sample(1)
+			found = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+
+			drawn[y[found] * width + x[found]] = id
+
+		palette = np.array(list(colors) + [(0, 0, 0, 0)])
+
+		return palette[drawn].reshape(height, width, 4)
+
+	def paths(vertices, codes):
+
+		# One compound path per layer, so the number of drawn objects only
+		# grows with the number of layers rather than the number of edges
+
+		codes = np.tile(codes, size)
+
+		return [mpl.path.Path(vertices[i * size : (i + 1) * size].reshape(-1, 2), codes) for i in range(len(indexes))]
 
 	wn.filterwarnings("ignore")
 
@@ -93,30 +196,32 @@ def group(**options):
 
 		self = Names.get(named, None)
 
-	elif order != None:
+	elif order in Order:
 
-		self = Order.get(order, None)
+		self = Order[order]
+
+	elif isinstance(order, int) and order >= 0:
+
+		self = cayley_dickson_algebra(order)()
 
 	else:
 
 		self = None
 
-	if self == None or (hasattr(self, "order") and self.order > 5):
+	if self == None:
 
 		raise NotImplementedError
 
 	size = self.dimensions * 2
-	groups = np.zeros((size, size), dtype=int)
+	groups = cayley()
+	parents = np.arange(size)
+	components = size
 	indices = list(indices)
 	figsize = (figsize, figsize)
 	connections = []
 	layered = []
 	indexes = []
 
-	for a, b in it.product(identity(), repeat=2):
-
-		groups[indexer(a), indexer(b)] = indexer(a * b)
-
 	if layers:
 
 		layers = layers.split(",")
@@ -172,18 +277,31 @@ def group(**options):
 			continue
 
 		connections.append(edges(index))
-		total = nx.from_numpy_array(sum(connections))
 		indexes.append(index)
 
-		if nx.is_connected(total) and not (showall or showpos or showneg):
+		# Connectivity is only needed to stop once the graph is connected
+
+		if not (showall or showpos or showneg):
+
+			components -= connect(connections[-1])
 
-			break
+			if components == 1:
+
+				break
 
 	# Create Graph
 
+	# Nodes, labels and arrows shrink beyond 64 nodes to fit the wider layouts
+
 	graph = nx.MultiDiGraph()
+	shrink = min(1.0, np.sqrt(64 / size))
+	dense = 2 ** 13
+	node_size = 750 * shrink ** 2
+	arrowsize = 35 * shrink
+	fontsize = fontsize * shrink
 	fig, ax = plt.subplots(figsize=figsize, dpi=figdpi)
 	pos = df.locationmap(self.order, size)
+	points = np.array([pos[id] for id in range(size)])
 	fig.set_facecolor("black")
 	ax.margins(0.05)
 	ax.axis("off")
@@ -197,55 +315,63 @@ def group(**options):
 
 		add_node(graph, id, color, label)
 
-	# Add Edges
+	# Add Edges (every layer connects each node once, so a pair of nodes only
+	# shares edges when a layer is repeated, which then curves further out)
+
+	count = len(connections)
+	sources = np.tile(np.arange(size), count)
+	targets = np.concatenate(connections) if count else np.zeros(0, dtype=int)
+	radius = np.repeat([0.1 + 0.05 * indexes[:id].count(index) for id, index in enumerate(indexes)], size)
+	colors = [df.color(self.order, index) for index in indexes]
 
-	for id, connection in enumerate(connections):
+	# Draw Nodes (all nodes and labels in one call each)
 
-		color = df.color(self.order, indexes[id])
+	nx_node_opts = {
+		"nodelist": list(graph.nodes),
+		"node_color": [data["color"] for _, data in graph.nodes(data=True)],
+		"node_size": node_size,
+		"node_shape": "o",
+		"edgecolors": "darkgray",
+		"margins": 0.1
+	}
 
-		for e1, e2 in zip(*np.where(connection)):
+	nx_label_opts = {
+		"labels": {id: data["label"] for id, data in graph.nodes(data=True)},
+		"font_size": fontsize,
+		"font_color": "black"
+	}
 
-			add_edge(graph, e1, e2, color)
+	nx.draw_networkx_nodes(graph, pos, **nx_node_opts)
+	nx.draw_networkx_labels(graph, pos, **nx_label_opts)
 
-	# Draw Nodes
+	# Draw Edges (all curves in one collection and all heads in another, or
+	# for dense graphs all of them in one image)
 
-	for id, data in graph.nodes(data=True):
+	plt.tight_layout()
 
-		nx_node_opts = {
-			"nodelist": [id],
-			"node_color": data["color"],
-			"node_size": 750,
-			"node_shape": "o",
-			"edgecolors": "darkgray",
-			"margins": 0.1
-		}
+	# The curves are laid out twice, the first pass only extends the axis
+	# limits to fit them, as adding each arrow as a patch used to
 
-		nx_label_opts = {
-			"labels": {id: data["label"]},
-			"font_size": fontsize,
-			"font_color": "black"
-		}
+	ax.autoscale_view()
+	curves, heads = arrows(sources, targets, radius)
+	ax.update_datalim(data(curves).reshape(-1, 2))
+	ax.autoscale_view()
+	curves, heads = arrows(sources, targets, radius)
 
-		nx.draw_networkx_nodes(graph, pos, **nx_node_opts)
-		nx.draw_networkx_labels(graph, pos, **nx_label_opts)
+	if len(sources) > dense:
 
-	# Draw Edges
+		fig.figimage(raster(curves, heads), origin="lower", zorder=-1)
 
-	for e1, e2, data in graph.edges(data=True):
+	else:
 
-		nx_edge_opts = {
-			"edgelist": [(e1,e2)],
-			"edge_color": data["color"],
-			"connectionstyle": "arc3, rad = " + str(data["radius"]),
-			"arrowstyle": "-|>",
-			"arrowsize": 35,
-			"arrows": True,
-			"width": 1.0
-		}
+		Path = mpl.path.Path
+		curves = paths(data(curves), [Path.MOVETO, Path.CURVE3, Path.CURVE3])
+		heads = paths(data(heads), [Path.MOVETO, Path.LINETO, Path.LINETO, Path.CLOSEPOLY])
 
-		nx.draw_networkx_edges(graph, pos, **nx_edge_opts)
+		ax.add_collection(mpl.collections.PathCollection(curves, facecolors="none", edgecolors=colors, linewidths=1.0 * shrink, zorder=1, clip_on=False), autolim=False)
+		ax.add_collection(mpl.collections.PathCollection(heads, facecolors=colors, edgecolors=colors, linewidths=1.0 * shrink, zorder=1, clip_on=False), autolim=False)
 
-	plt.tight_layout()
+		plt.tight_layout()
 
 	if save:
 
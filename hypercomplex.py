@@ -1,11 +1,21 @@
-from functools import lru_cache
+from functools import wraps
 from dunders import dunders, math
-from numbers import Number
+from numbers import Number, Real as RealNumber
+from collections.abc import Mapping
 
+import caching as cc
+import formatting as fm
+import kernels as kn
 import numpy as np
+import structure as st
 
 class BaseNumber(Number):
 
+	# Instances are slot based (no per instance __dict__), each algebra
+	# declares only the storage it uses in its own __slots__
+
+	__slots__ = ()
+
 	def copy(self):
 
 		return self.__class__(self)
@@ -16,12 +26,19 @@ class BaseNumber(Number):
 
 	def square(self):
 
-		return (self.conjugate() * self).real
+		# Sum of squares of the coefficients, the real part of conjugate * self
+		# without computing the rest of the product
+
+		return self.base()(sum(x * x for x in self.coefficients()))
 
 	def norm(self):
 
 		return np.sqrt(self.square())
 
+	def normalize(self):
+
+		return self / self.norm()
+
 	def __abs__(self):
 
 		return self.norm()
@@ -58,497 +75,1524 @@ class BaseNumber(Number):
 
 		return "(" + ", ".join([str(x) for x in self.coefficients()]) + ")"
 
-def cayley_dickson_real_base(base=float):
+# NumPy Ufunc Support
+# Maps ufuncs onto coefficient array operations, all hypercomplex inputs are
+# promoted to the highest order algebra and real inputs onto its real axis
+
+ufuncs = {
+	"add": np.add,
+	"subtract": np.subtract,
+	"multiply": st.multiply,
+	"divide": st.divide,
+	"true_divide": st.divide,
+	"negative": np.negative,
+	"positive": np.positive,
+	"conjugate": st.conjugate,
+	"reciprocal": st.inverse,
+	"square": lambda x, out=None: st.multiply(x, x, out=out),
+	"absolute": lambda x, out=None: np.sqrt(st.square(x), out=out),
+	"equal": lambda x, y, out=None: np.all(x == y, axis=-1, out=out),
+	"not_equal": lambda x, y, out=None: np.any(x != y, axis=-1, out=out),
+	"exp": lambda x, out=None: written(st.exp(x), out),
+	"log": lambda x, out=None: written(st.log(x), out),
+	"sqrt": lambda x, out=None: written(st.sqrt(x), out),
+	"sin": lambda x, out=None: written(st.sin(x), out),
+	"cos": lambda x, out=None: written(st.cos(x), out)
+}
 
-	if not issubclass(base, Number):
+# Reals are ufuncs whose result is a plain ndarray of real values
+# Associative algebras (up to quaternions) can reduce products pairwise
 
-		raise TypeError("The base type must be derived from Number.")
+reals = ("absolute", "equal", "not_equal")
+associative = 2
 
-	@dunders(base=base, names=math, force=False)
-	class Real(BaseNumber, base):
+def written(result, out=None):
 
-		dimensions = 1
-		order = 0
+	if out is None:
 
-		@staticmethod
-		def base():
+		return result
 
-			return base
+	out[...] = result
 
-		@property
-		def real(self):
+	return out
 
-			return base(self)
+def ufunc(function, method, *inputs, out=None, **options):
 
-		@property
-		def imag(self):
+	operation = ufuncs.get(function.__name__)
 
-			return base(0)
+	if operation is None or options.keys() - {"axis"}:
 
-		def coefficients(self):
+		return NotImplemented
 
-			return (self.real,)
+	numbers = [x for x in inputs + (out or ()) if isinstance(x, (HyperComplexArray, BaseNumber))]
+	numbers = [x for x in numbers if x.dimensions > 1]
+	algebra = max(numbers, key=lambda x: x.dimensions)
+	algebra = algebra.algebra if isinstance(algebra, HyperComplexArray) else type(algebra)
 
-		def conjugate(self):
+	def coefficients(x):
 
-			return Real(self)
+		if isinstance(x, HyperComplexArray):
 
-		def __hash__(self):
+			return algebra.Array.pad(x.array)
 
-			return hash(base(self))
+		if isinstance(x, BaseNumber) and x.dimensions > 1:
 
-	return Real
+			return algebra.Array.pad(st.typed(x.coefficients(), algebra.base(), algebra.dtype))
 
-def cayley_dickson_construction(parent):
+		return algebra.Array.pad(st.typed(x, algebra.base(), algebra.dtype)[..., None])
 
-	if not hasattr(parent, "coefficients"):
+	batched = any(np.ndim(x) for x in inputs if not isinstance(x, BaseNumber))
+	values = [coefficients(x) for x in inputs]
+	target = None
 
-		raise ValueError("The parent type must be Real or HyperComplex. (No coefficients found.)")
+	if out is not None:
 
-	def option(name, default, **options):
+		target = out[0]
 
-		if name in options:
+		# Array stored numbers are written through their coefficient array,
+		# tree stored numbers have no buffer to write into
 
-			return options[name]
+		if isinstance(target, HyperComplexArray):
 
-		return default
+			out = target.array
 
-	class HyperComplex(BaseNumber):
+		elif isinstance(target, BaseNumber):
 
-		# Class Data Properties
+			if getattr(type(target), "storage", None) != "array" or target.dimensions == 1:
 
-		dimensions = parent.dimensions * 2
-		order = parent.order + 1
+				return NotImplemented
 
-		@property
-		def real(self):
+			out = target.array
 
-			return self.a.real
+		else:
 
-		@property
-		def imag(self):
+			out = target
 
-			if len(self) == 2:
+	if method == "__call__":
 
-				return self.b
+		result = operation(*values, out=out)
 
-			return tuple(self.a.imag) + self.b.coefficients()
+	elif method in ("reduce", "accumulate") and function.__name__ in ("add", "multiply"):
 
-		# HyperComplex Data Manipulation
+		if options.get("axis", 0) not in (0, None) or not isinstance(inputs[0], HyperComplexArray):
 
-		@staticmethod
-		def coerce(other):
+			return NotImplemented
 
-			try:
+		result = reduction(function.__name__, method, values[0], algebra.order, out)
+		batched = method == "accumulate"
 
-				return HyperComplex(other)
+	else:
 
-			except TypeError:
+		return NotImplemented
 
-				return None
+	if target is not None:
 
-		@staticmethod
-		def base():
+		return target
 
-			return parent.base()
+	if function.__name__ in reals:
 
-		# HyperComplex.indexes(index) returns base index for HyperComplex.matric use
-		# HyperComplex.values(index)  returns index value for HyperComplex.outerproduct use
-		# HyperComplex.named(input)   returns named index (e0, e1) or (1, i), etc
+		return result
 
-		def indexes(self, index, **args):
+	if batched:
 
-			base = self.base()
-			result = [base(0)] * self.dimensions
-			result[index] = base(1)
+		return algebra.Array.fromarray(st.typed(result, algebra.base(), algebra.dtype))
 
-			return HyperComplex(*result)
+	return algebra(result)
 
-		def values(self, index, **args):
+def reduction(name, method, values, order, out=None):
 
-			base = self.base()
-			coefficients = self.coefficients()
-			result = [base(0)] * self.dimensions
-			result[index] = coefficients[index]
+	# Products are always taken left to right, ((x0 * x1) * x2) * ...,
+	# which is only regrouped into pairwise products for associative algebras
 
-			return HyperComplex(*result)
+	if name == "add":
 
-		def named(self, input, **args):
+		if method == "reduce":
 
-			# Optional Arguments
+			return np.sum(values, axis=0, out=out)
 
-			element = option("element", "e", **args)
-			indices = option("indices", "1ijkLIJKmpqrMPQRnstuNSTUovwxOVWX", **args)
-			translate = option("translate", True, **args)
-			asindex = option("asindex", False, **args)
-			asstring = option("asstring", False, **args)
-			astuple = option("astuple", False, **args)
-			aslist = option("aslist", False, **args)
-			asobject = option("asobject", False, **args)
-			showplus = option("showplus", False, **args)
-			index = option("index", None, **args)
-			value = option("value", input, **args)
+		return np.cumsum(values, axis=0, out=out)
 
-			plus = "+" if showplus else ""
-			base = self.base()
+	if method == "reduce" and order <= associative:
 
-			if type(indices) != list:
+		while len(values) > 1:
 
-				indices = list(indices)
+			pairs = len(values) // 2 * 2
+			result = st.multiply(values[:pairs:2], values[1:pairs:2])
+			values = np.concatenate((result, values[pairs:]))
 
-			# index, value filters
+		result = values[0] if len(values) else st.unit(values.shape[-1])
 
-			if hasattr(input, "coefficients"):
+	elif method == "reduce":
 
-				# Added this to fix issue when doing outerproduct and having 0 values anywhere
-				# if any value is 0, return 0 immediately so the next() section doesn't throw a
-				# type error
+		result = values[0] if len(values) else st.unit(values.shape[-1])
 
-				if not input:
+		for value in values[1:]:
 
-					return 0
+			result = st.multiply(result, value)
 
-				coefficients = input.coefficients()
-				enum = enumerate(coefficients)
+	else:
 
-				index, value = next(((index, value) for index, value in enum if value))
+		result = np.array(values)
 
-			elif type(value) is int and type(index) is int:
+		for index in range(1, len(result)):
 
-				# Used by the group() function to add named elements
-				# to the rotation graph
+			result[index] = st.multiply(result[index - 1], values[index])
 
-				# group() required 0 index, plot() 1 index starting arrays,
-				# group() also shows negativity as > len(self) numbering
+	if out is not None:
 
-				is_negative = index >= len(self)
+		out[...] = result
 
-				if asstring and translate:
+		return out
 
-					value = base(-1) if is_negative else base(+1)
-					index -= len(self) if is_negative else 0
+	return result
 
-			# text filters
+def promoted(method):
 
-			if asindex:
+	# Binary HyperComplexArray operations with a higher order HyperComplex
+	# operand are carried out using the array type of that operands algebra
 
-				# Used bu the HyperComplex.plot() functions to generate
-				# the base matricies used to generate the graphs
+	@wraps(method)
+	def wrapper(self, other):
 
-				input = int(F"-{index+1}") if value < 0 else int(F"{index+1}")
+		if isinstance(other, BaseNumber) and other.dimensions > self.dimensions:
 
-			elif asstring and not (asobject | astuple | aslist):
+			return getattr(other.Array(self), method.__name__)(other)
 
-				# Output Named/String Array, using either e0 + e1 + e2 + e3 format or the
-				# letter indices like 1 + i + j + k
+		return method(self, other)
 
-				enabled = translate and self.dimensions <= len(indices)
-				translated = indices[index] if enabled else F"{element}{index}"
+	return wrapper
 
-				sign = "-" if value < 0 else plus
-				value = "" if abs(value) == base(1) else "{:g}".format(abs(value))
-				translated = "" if translated == "1" and value else translated
-				input = F"{sign}{value}{translated}"
+class HyperComplexArray:
 
-			return input
+	# Batched container of hypercomplex numbers, stored as one (N, dimensions)
+	# ndarray with a row per number (float64, or object for other base types).
+	# Each algebra has its own subclass availible as HyperComplex.Array, which
+	# sets the algebra it holds.
 
-		def coefficients(self):
+	# Plain numbers and numeric ndarrays are treated as real values, so an (N,)
+	# ndarray (for example the result of norm()) broadcasts one value per row.
 
-			return self.a.coefficients() + self.b.coefficients()
+	algebra = None
+	dimensions = 0
+	order = 0
 
-		def zero(self):
+	__slots__ = ("array",)
+	__hash__ = None
 
-			if isinstance(self.a, Number):
+	def __init__(self, values=()):
 
-				return HyperComplex(0, 0)
+		if isinstance(values, HyperComplexArray):
 
-			else:
+			values = values.array
 
-				return HyperComplex(self.a.zero(), self.b.zero())
+		base = self.algebra.base()
+		dtype = self.algebra.dtype
 
-		def __init__(self, *args):
+		if isinstance(values, np.ndarray) and values.dtype != object:
 
-			# Added list/tuple type as allowed arguments
-			# Remove need for pair=True
+			array = np.array(st.typed(values, base, dtype), ndmin=2)
 
-			if len(args) == 2:
+		else:
 
-				self.a, self.b = map(parent, args)
+			array = [self.algebra(value).coefficients() for value in values]
+			array = st.typed(array, base, dtype).reshape(-1, self.dimensions)
 
-			else:
+		if array.ndim != 2 or array.shape[1] > self.dimensions:
 
-				if len(args) == 1:
+			shape = array.shape
+			size = self.dimensions
 
-					if hasattr(args[0], "coefficients"):
+			raise TypeError(F"Invalid shape {shape}, expecting (N, {size}) or fewer coefficients.")
 
-						args = args[0].coefficients()
+		self.array = self.pad(array)
 
-					elif isinstance(args[0], complex):
+	# HyperComplexArray.fromarray(array) returns instance using array as storage (no copy)
+	# HyperComplexArray.zeros(size)      returns array of size zero values
+	# HyperComplexArray.pad(array)       returns array zero padded to the algebra dimensions
 
-						args = args[0].real, args[0].imag
+	@classmethod
+	def fromarray(cls, array):
 
-					elif type(args[0]) is tuple:
+		result = cls.__new__(cls)
+		result.array = array
 
-						args = args[0]
+		return result
 
-					elif type(args[0]) is list:
+	@classmethod
+	def zeros(cls, size):
 
-						args = tuple(args[0])
+		return cls.fromarray(st.zeros((size, cls.dimensions), cls.algebra.base(), cls.algebra.dtype))
 
-				if len(args) > len(self):
+	@classmethod
+	def pad(cls, array):
 
-					la = len(args)
-					ls = len(self)
+		if array.shape[-1] == cls.dimensions:
 
-					raise TypeError(F"Too many args. Got {la} expecting at most {ls}.")
+			return array
 
-				if len(self) != len(args):
+		result = st.zeros(array.shape[:-1] + (cls.dimensions,), cls.algebra.base(), cls.algebra.dtype)
+		result[..., :array.shape[-1]] = array
 
-					args += (HyperComplex.base()(),) * (len(self) - len(args))
+		return result
 
-				self.a = parent(*args[:len(self) // 2])
-				self.b = parent(*args[len(self) // 2:])
+	@staticmethod
+	def isreal(other):
 
-		def __hash__(self):
+		if isinstance(other, np.ndarray):
 
-			return hash(self.coefficients())
+			return other.dtype != object
 
-		def __iter__(self):
+		return isinstance(other, RealNumber)
 
-			if isinstance(self.a, Number):
+	def scalar(self, other):
 
-				yield self.a
-				yield self.b
+		# Real operands (one per row or shared) in the storage type
 
-				return
+		return st.typed(other, self.algebra.base(), self.array.dtype)
 
-			for i in self.a:
+	def coerce(self, other):
 
-				yield i
+		if isinstance(other, HyperComplexArray):
 
-			for i in self.b:
+			if other.dimensions > self.dimensions:
 
-				yield i
+				return None
 
-		# HyperComplex Products Display
+			return self.pad(other.array)
 
-		# HyperComplex.outerproduct()    returns tensor outer product of AB'
-		# HyperCompex.innerproctuct()    returns scalar inner product of A'B
-		# HyperCompex.hadamardproctuct() returns vector hadamard product of AB
-		# HyperCompex.matrix()           returns multiplication matrix
+		other = self.algebra.coerce(other)
 
-		def matrixdisplay(self, result, **args):
+		if other is None:
 
-			asstring = option("asstring", False, **args)
-			asobject = option("asobject", False, **args)
-			astuple = option("astuple", False, **args)
-			aslist = option("aslist", False, **args)
+			return None
 
-			if asstring and not (asobject | astuple | aslist):
+		return st.typed(other.coefficients(), self.algebra.base(), self.algebra.dtype)
 
-				result = [list(map(str, row)) for row in result]
-				length = max(len(cell) for row in result for cell in row)
-				offset = length - max(len(row[0]) for row in result)
-				rows = [" ".join(cell.rjust(length) for cell in row)[offset:] for row in result]
+	# HyperComplexArray Data Properties
 
-				return "\n".join(rows)
+	@property
+	def shape(self):
 
-			return result
+		return self.array.shape
 
-		def outerproduct(self, other, **args):
+	@property
+	def real(self):
 
-			asobject = option("asobject", False, **args)
-			astuple = option("astuple", False, **args)
-			aslist = option("aslist", False, **args)
+		return self.array[:, 0]
 
-			other = HyperComplex.coerce(other)
+	@property
+	def imag(self):
 
-			if other is None:
+		return self.array[:, 1:]
 
-				return NotImplemented
+	def __len__(self):
 
-			other = other.conjugate()
+		return len(self.array)
 
-			a = list(map(self.values, range(self.dimensions)))
-			b = list(map(other.values, range(other.dimensions)))
+	def __iter__(self):
 
-			result = [[self.named(i * j, **args) for j in b] for i in a]
+		for row in self.array:
 
-			if asobject | astuple | aslist:
+			yield self.algebra(row)
 
-				size = len(result)
+	def __getitem__(self, index):
 
-				for i, j in np.ndindex(size, size):
+		result = self.array[index]
 
-					temp = result[i][j]
-					temp = temp.astuple() if astuple else temp
-					temp = temp.asobject() if asobject else temp
-					temp = temp.aslist() if aslist else temp
+		if result.ndim == 1:
 
-					result[i][j] = temp
+			return self.algebra(result)
 
-			result = self.matrixdisplay(result, **args)
+		return self.fromarray(result)
 
-			return result
+	def __setitem__(self, index, value):
 
-		def innerproduct(self, other):
+		if isinstance(value, HyperComplexArray):
 
-			return (self.conjugate() * other).real
+			value = self.coerce(value)
 
-		def hadamardproduct(self, other, **args):
+		else:
 
-			asobject = option("asobject", False, **args)
-			astuple = option("astuple", False, **args)
-			aslist = option("aslist", False, **args)
+			value = self.algebra(value).coefficients()
 
-			other = HyperComplex.coerce(other)
-			base = self.base()
+		self.array[index] = value
 
-			if other is None:
+	def __array__(self, dtype=None, copy=None):
 
-				return NotImplemented
+		if copy:
 
-			a = self.coefficients()
-			b = other.coefficients()
+			return np.array(self.array, dtype=dtype)
 
-			result = [base(0)] * self.dimensions
+		return np.asarray(self.array, dtype=dtype)
 
-			for i in range(self.dimensions):
+	def __array_ufunc__(self, function, method, *inputs, **options):
 
-				x = a[i]
-				y = b[i]
+		return ufunc(function, method, *inputs, **options)
 
-				result[i] = self.named(base(x * y), index=i, **args)
+	def __str__(self):
 
-			if asobject | astuple | aslist:
+		return "[" + ",\n ".join(str(value) for value in self) + "]"
 
-				result = HyperComplex(result)
+	def __repr__(self):
 
-				result = result.astuple() if astuple else result
-				result = result.asobject() if asobject else result
-				result = result.aslist() if aslist else result
+		return str(self)
 
-			result = self.matrixdisplay(result, **args)
+	# Output Types
 
-			return result
+	def copy(self):
 
-		def matrix(self, **args):
+		return self.fromarray(self.array.copy())
 
-			asobject = option("asobject", False, **args)
-			astuple = option("astuple", False, **args)
-			aslist = option("aslist", False, **args)
+	def asarray(self):
 
-			a = list(map(self.indexes, range(self.dimensions)))
+		return self.array.copy()
 
-			result = [[self.named(i * j, **args) for j in a] for i in a]
+	def aslist(self):
 
-			if asobject | astuple | aslist:
+		return list(self)
 
-				size = len(result)
+	# HyperComplexArray Comparison
 
-				for i, j in np.ndindex(size, size):
+	@promoted
+	def __eq__(self, other):
 
-					temp = result[i][j]
-					temp = temp.astuple() if astuple else temp
-					temp = temp.asobject() if asobject else temp
-					temp = temp.aslist() if aslist else temp
+		if self.isreal(other):
 
-					result[i][j] = temp
+			other = self.pad(st.typed(other, self.algebra.base(), self.algebra.dtype)[..., None])
 
-			result = self.matrixdisplay(result, **args)
+		else:
 
-			return result
+			other = self.coerce(other)
 
-		# Output Types
+		if other is None:
 
-		def asobject(self):
+			return NotImplemented
 
-			return HyperComplex(self)
+		return np.all(self.array == other, axis=-1)
 
-		def astuple(self):
+	def isclose(self, other, **args):
 
-			return tuple(self.coefficients())
+		# Batched HyperComplex.isclose, one boolean per row
 
-		def aslist(self):
+		if isinstance(other, BaseNumber) and other.dimensions > self.dimensions:
 
-			return list(self.coefficients())
+			return other.Array(self).isclose(other, **args)
 
-		def asstring(self, **args):
+		tolerance = args.get("tolerance", self.algebra.tolerance or 1e-9)
+		tolerance = abs(self.algebra.base()(tolerance))
 
-			values = list(map(self.values, range(self.dimensions)))
-			values = [self.named(i, asstring=True, **args) for i in values]
-			values = [str(row) for row in values]
+		if self.isreal(other):
 
-			result = values.pop(0)
+			other = self.pad(st.typed(other, self.algebra.base(), self.algebra.dtype)[..., None])
 
-			for value in values:
+		else:
 
-				result += (value[:1] == "-" and [" - " + value[1:]] or [" + " + value])[0]
+			other = self.coerce(other)
 
-			return result
+		if other is None:
 
-		# HyperComplex Comparison
+			raise TypeError(F"Cannot compare {type(self).__name__} with {type(other).__name__}")
 
-		def __eq__(self, other):
+		return np.all(np.abs(self.array - other) <= tolerance * (1 + np.abs(other)), axis=-1)
 
-			other = HyperComplex.coerce(other)
+	@promoted
+	def __ne__(self, other):
 
-			if other is None:
+		result = self == other
 
-				return NotImplemented
+		if result is NotImplemented:
 
-			return self.a == other.a and self.b == other.b
+			return NotImplemented
 
-		def __ne__(self, other):
+		return ~result
 
-			return not self == other
+	# Mathematical Operations
 
-		def __lt__(self, other):
+	def conjugate(self):
 
-			other = HyperComplex.coerce(other)
+		return self.fromarray(st.conjugate(self.array))
 
-			if other is None:
+	def square(self):
 
-				return NotImplemented
+		return st.square(self.array)
 
-			return self.square() < other.square()
+	def norm(self):
 
-		def __le__(self, other):
+		return st.norm(self.array)
 
-			return self < other or self == other
+	def inverse(self):
 
-		def __gt__(self, other):
+		return self.fromarray(st.inverse(self.array))
 
-			other = HyperComplex.coerce(other)
+	def normalize(self):
 
-			if other is None:
+		return self.fromarray(st.normalize(self.array))
 
-				return NotImplemented
+	@promoted
+	def innerproduct(self, other):
 
-			return self.square() > other.square()
+		other = self.coerce(other)
 
-		def __ge__(self, other):
+		if other is None:
 
-			return self > other or self == other
+			return NotImplemented
 
-		# Mathematical Conversion
+		return np.einsum("...i,...i->...", self.array, other)
 
-		def convert(self, ctype, dimensions=1):
+	# HyperComplexArray.outerproduct(other)     returns (N, dimensions, dimensions) ndarray of outer products
+	# HyperComplexArray.hadamardproduct(other)  returns (N, dimensions) ndarray of coefficient products
 
-			coefficients = self.coefficients()
+	@promoted
+	def outerproduct(self, other):
 
-			if any(coefficients[dimensions:]):
+		other = self.coerce(other)
 
-				size = self.dimensions
-				classname = self.__class__.__name__
-				typename = ctype.__name__
+		if other is None:
 
-				raise TypeError(F"Error converting {classname}[{size}] to {typename}: There are non-zero incompatible coefficients.")
+			return NotImplemented
+
+		return st.outer(self.array, st.conjugate(other))
+
+	@promoted
+	def hadamardproduct(self, other):
+
+		other = self.coerce(other)
+
+		if other is None:
+
+			return NotImplemented
+
+		return st.hadamard(self.array, other)
+
+	def retyped(self, array):
+
+		# Results of the polar and transcendental kernels (floating point)
+		# converted back to the type the algebra stores
+
+		return self.fromarray(st.typed(array, self.algebra.base(), self.algebra.dtype))
+
+	def exp(self):
+
+		return self.retyped(st.exp(self.array))
+
+	def log(self):
+
+		return self.retyped(st.log(self.array))
+
+	def sqrt(self):
+
+		return self.retyped(st.sqrt(self.array))
+
+	def sin(self):
+
+		return self.retyped(st.sin(self.array))
+
+	def cos(self):
+
+		return self.retyped(st.cos(self.array))
+
+	# HyperComplexArray.slerp(other, t) returns the spherical interpolation between each pair
+	# HyperComplexArray.squad(times)    returns the squad spline through the keyframes at times
+
+	def slerp(self, other, t):
+
+		other = self.coerce(other)
+
+		if other is None:
+
+			return NotImplemented
+
+		return self.retyped(st.slerp(self.array, other, t))
+
+	def squad(self, times):
+
+		return self.retyped(np.atleast_2d(st.squad(self.array, times)))
+
+	def __abs__(self):
+
+		return self.norm()
+
+	def __pow__(self, power):
+
+		if not HyperComplexArray.isreal(power) or np.ndim(power):
+
+			return NotImplemented
+
+		return self.retyped(st.power(self.array, power))
+
+	def __neg__(self):
+
+		return self.fromarray(-self.array)
+
+	# In Place Operations
+
+	def __iadd__(self, other):
+
+		if self.isreal(other):
+
+			self.array[:, 0] += self.scalar(other)
+
+			return self
+
+		other = self.coerce(other)
+
+		if other is None:
+
+			return NotImplemented
+
+		self.array += other
+
+		return self
+
+	def __isub__(self, other):
+
+		if self.isreal(other):
+
+			self.array[:, 0] -= self.scalar(other)
+
+			return self
+
+		other = self.coerce(other)
+
+		if other is None:
+
+			return NotImplemented
+
+		self.array -= other
+
+		return self
+
+	def __imul__(self, other):
+
+		if self.isreal(other):
+
+			self.array *= self.scalar(other)[..., None]
+
+			return self
+
+		other = self.coerce(other)
+
+		if other is None:
+
+			return NotImplemented
+
+		st.multiply(self.array, other, out=self.array)
+
+		return self
+
+	def __itruediv__(self, other):
+
+		if self.isreal(other):
+
+			self.array /= self.scalar(other)[..., None]
+
+			return self
+
+		other = self.coerce(other)
+
+		if other is None:
+
+			return NotImplemented
+
+		st.divide(self.array, other, out=self.array)
+
+		return self
+
+	# HyperComplexArray.mul_into(out, x, y) style methods write into the storage of out,
+	# using the same rules as the numpy ufuncs (see ufunc)
+
+	@staticmethod
+	def add_into(out, x, y):
+
+		return np.add(x, y, out=out)
+
+	@staticmethod
+	def sub_into(out, x, y):
+
+		return np.subtract(x, y, out=out)
+
+	@staticmethod
+	def mul_into(out, x, y):
+
+		return np.multiply(x, y, out=out)
+
+	@staticmethod
+	def div_into(out, x, y):
+
+		return np.divide(x, y, out=out)
+
+	def __pos__(self):
+
+		return self.fromarray(+self.array)
+
+	@promoted
+	def __add__(self, other):
+
+		if self.isreal(other):
+
+			result = self.array.copy()
+			result[:, 0] += self.scalar(other)
+
+			return self.fromarray(result)
+
+		other = self.coerce(other)
+
+		if other is None:
+
+			return NotImplemented
+
+		return self.fromarray(self.array + other)
+
+	@promoted
+	def __radd__(self, other):
+
+		return self + other
+
+	@promoted
+	def __sub__(self, other):
+
+		if self.isreal(other):
+
+			result = self.array.copy()
+			result[:, 0] -= self.scalar(other)
+
+			return self.fromarray(result)
+
+		other = self.coerce(other)
+
+		if other is None:
+
+			return NotImplemented
+
+		return self.fromarray(self.array - other)
+
+	@promoted
+	def __rsub__(self, other):
+
+		return (-self) + other
+
+	@promoted
+	def __mul__(self, other):
+
+		if self.isreal(other):
+
+			return self.fromarray(self.array * self.scalar(other)[..., None])
+
+		other = self.coerce(other)
+
+		if other is None:
+
+			return NotImplemented
+
+		return self.fromarray(st.multiply(self.array, other))
+
+	@promoted
+	def __rmul__(self, other):
+
+		if self.isreal(other):
+
+			return self * other
+
+		other = self.coerce(other)
+
+		if other is None:
+
+			return NotImplemented
+
+		return self.fromarray(st.multiply(other, self.array))
+
+	@promoted
+	def __truediv__(self, other):
+
+		if self.isreal(other):
+
+			return self.fromarray(self.array / self.scalar(other)[..., None])
+
+		if isinstance(other, HyperComplexArray):
+
+			if other.dimensions > self.dimensions:
+
+				return NotImplemented
+
+			return self * self.fromarray(self.pad(other.array)).inverse()
+
+		other = self.algebra.coerce(other)
+
+		if other is None:
+
+			return NotImplemented
+
+		return self * other.inverse()
+
+	@promoted
+	def __rtruediv__(self, other):
+
+		return self.inverse().__rmul__(other)
+
+# Algebra Registry
+# Every generated class is canonical, Real classes are keyed by base type and
+# HyperComplex classes by parent class and options, so each (level, base) pair
+# is built once and shared by every caller, along with its multiplication
+# table, kernels and memoized results
+
+registry = {}
+
+def cayley_dickson_real_base(base=float):
+
+	if not issubclass(base, Number):
+
+		raise TypeError("The base type must be derived from Number.")
+
+	if (0, base) in registry:
+
+		return registry[0, base]
+
+	@dunders(base=base, names=math, force=False)
+	class Real(BaseNumber, base):
+
+		__slots__ = ()
+
+		dimensions = 1
+		order = 0
+
+		@staticmethod
+		def base():
+
+			return base
+
+		@property
+		def real(self):
+
+			return base(self)
+
+		@property
+		def imag(self):
+
+			return base(0)
+
+		def coefficients(self):
+
+			return (self.real,)
+
+		def conjugate(self):
+
+			return Real(self)
+
+		def __hash__(self):
+
+			return hash(base(self))
+
+	registry[0, base] = Real
+
+	return Real
+
+def cayley_dickson_construction(parent, storage=None, unrolled=False, dtype=None):
+
+	if not hasattr(parent, "coefficients"):
+
+		raise ValueError("The parent type must be Real or HyperComplex. (No coefficients found.)")
+
+	# Storage Modes
+	# "tree"  stores the value as a recursive pair (a, b) of parent objects
+	# "array" stores the value as one contiguous ndarray, a and b are views, float
+	#         bases use float64 and other bases (int, Fraction, Decimal) object arrays
+
+	if storage is None:
+
+		storage = getattr(parent, "storage", "array")
+
+	if storage not in ("array", "tree"):
+
+		raise ValueError(F"Unknown storage mode {storage}, expecting array or tree.")
+
+	# Coefficient Types
+	# dtype sets the array element type, E.g. np.float32 to halve the memory of
+	# float arrays, np.longdouble for extra precision or np.complex128 (with a
+	# complex base), by default float64 for float bases and object otherwise
+
+	if dtype is None:
+
+		dtype = getattr(parent, "dtype", st.datatype(parent.base()))
+
+	dtype = np.dtype(dtype)
+
+	if dtype.kind == "c" and not issubclass(parent.base(), complex):
+
+		raise TypeError("Complex coefficients require a complex base type.")
+
+	key = (parent, storage, bool(unrolled), dtype)
+
+	if key in registry:
+
+		return registry[key]
+
+	# Unrolled Kernels
+	# unrolled=True replaces the generic multiply, conjugate, square and inverse
+	# with straight line functions generated for this order (see kernels.py)
+
+	kernel = kn.load(parent.order + 1, parent.base()) if unrolled else None
+
+	def option(name, default, **options):
+
+		if name in options:
+
+			return options[name]
+
+		return default
+
+	class HyperComplex(BaseNumber):
+
+		# Class Data Properties
+
+		dimensions = parent.dimensions * 2
+		order = parent.order + 1
+
+		__slots__ = ("array", "__weakref__") if storage == "array" else ("a", "b", "__weakref__")
+
+		if storage == "array":
+
+			@property
+			def a(self):
+
+				return HyperComplex.half(self.array[:len(self) // 2])
+
+			@a.setter
+			def a(self, value):
+
+				self.array[:len(self) // 2] = st.typed(parent(value).coefficients(), HyperComplex.base(), HyperComplex.dtype)
+
+			@property
+			def b(self):
+
+				return HyperComplex.half(self.array[len(self) // 2:])
+
+			@b.setter
+			def b(self, value):
+
+				self.array[len(self) // 2:] = st.typed(parent(value).coefficients(), HyperComplex.base(), HyperComplex.dtype)
+
+		@property
+		def real(self):
+
+			if HyperComplex.storage == "array":
+
+				return HyperComplex.base()(self.array[0])
+
+			return self.a.real
+
+		@property
+		def imag(self):
+
+			if len(self) == 2:
+
+				return self.b
+
+			if HyperComplex.storage == "array":
+
+				return tuple(self.array[1:].tolist())
+
+			return tuple(self.a.imag) + self.b.coefficients()
+
+		# HyperComplex Data Manipulation
+
+		@staticmethod
+		def coerce(other):
+
+			# Operands of this algebra are used as they are, lower order numbers
+			# are promoted by the constructor, which has fast paths for reals and
+			# array stored values, and higher orders are left to the other operand
+
+			if isinstance(other, HyperComplex):
+
+				return other
+
+			if isinstance(other, BaseNumber):
+
+				return HyperComplex(other) if other.dimensions <= HyperComplex.dimensions else None
+
+			if isinstance(other, HyperComplexArray):
+
+				return None
+
+			try:
+
+				return HyperComplex(other)
+
+			except TypeError:
+
+				return None
+
+		@staticmethod
+		def scalar(other):
+
+			# Scalar operands in the base type, see structure.scalar
+
+			return st.scalar(other, HyperComplex.base(), HyperComplex.dtype)
+
+		@staticmethod
+		def base():
+
+			return parent.base()
+
+		# HyperComplex.fromarray(array) returns instance using array as storage (no copy)
+		# HyperComplex.half(array)      returns parent instance viewing half the storage
+
+		@staticmethod
+		def fromkernel(values):
+
+			if HyperComplex.storage == "array":
+
+				return HyperComplex.fromarray(st.typed(values, HyperComplex.base(), HyperComplex.dtype))
+
+			return HyperComplex(values)
+
+		@staticmethod
+		def fromarray(array):
+
+			if HyperComplex.storage != "array":
+
+				return HyperComplex(tuple(array))
+
+			result = HyperComplex.__new__(HyperComplex)
+			result.array = array
+
+			return result
+
+		# HyperComplex.cache(policy, maxsize) sets the memoization policy of this algebra
+		# HyperComplex.cache_info()           returns the memoization statistics per method
+
+		@staticmethod
+		def cache(policy="lru", maxsize=128):
+
+			return cc.configure(HyperComplex, policy, maxsize)
+
+		@staticmethod
+		def cache_info():
+
+			return cc.statistics(HyperComplex)
+
+		# HyperComplex.table() returns the cached (index, sign) multiplication table
+
+		@staticmethod
+		def table():
+
+			return st.table(HyperComplex.order)
+
+		@staticmethod
+		def half(array):
+
+			if getattr(parent, "storage", None) == "array":
+
+				return parent.fromarray(array)
+
+			return parent(*array.tolist())
+
+		# HyperComplex.indexes(index) returns base index for HyperComplex.matric use
+		# HyperComplex.values(index)  returns index value for HyperComplex.outerproduct use
+		# HyperComplex.named(input)   returns named index (e0, e1) or (1, i), etc
+
+		def indexes(self, index, **args):
+
+			base = self.base()
+			result = [base(0)] * self.dimensions
+			result[index] = base(1)
+
+			return HyperComplex(*result)
+
+		def values(self, index, **args):
+
+			base = self.base()
+			coefficients = self.coefficients()
+			result = [base(0)] * self.dimensions
+			result[index] = coefficients[index]
+
+			return HyperComplex(*result)
+
+		def named(self, input, **args):
+
+			# Optional Arguments
+
+			translate = option("translate", True, **args)
+			asindex = option("asindex", False, **args)
+			asstring = option("asstring", False, **args)
+			astuple = option("astuple", False, **args)
+			aslist = option("aslist", False, **args)
+			asobject = option("asobject", False, **args)
+			index = option("index", None, **args)
+			value = option("value", input, **args)
+
+			base = self.base()
+
+			# index, value filters
+
+			if hasattr(input, "coefficients"):
+
+				# Added this to fix issue when doing outerproduct and having 0 values anywhere
+				# if any value is 0, return 0 immediately so the next() section doesn't throw a
+				# type error
+
+				if not input:
+
+					return 0
+
+				coefficients = input.coefficients()
+				enum = enumerate(coefficients)
+
+				index, value = next(((index, value) for index, value in enum if value))
+
+			elif type(value) is int and type(index) is int:
+
+				# Used by the group() function to add named elements
+				# to the rotation graph
+
+				# group() required 0 index, plot() 1 index starting arrays,
+				# group() also shows negativity as > len(self) numbering
+
+				is_negative = index >= len(self)
+
+				if asstring and translate:
+
+					value = base(-1) if is_negative else base(+1)
+					index -= len(self) if is_negative else 0
+
+			# text filters
+
+			if asindex:
+
+				# Used bu the HyperComplex.plot() functions to generate
+				# the base matricies used to generate the graphs
+
+				input = int(F"-{index+1}") if value < 0 else int(F"{index+1}")
+
+			elif asstring and not (asobject | astuple | aslist):
+
+				# Output Named/String Array, using either e0 + e1 + e2 + e3 format or the
+				# letter indices like 1 + i + j + k
+
+				input = fm.formatter(HyperComplex, **args).label(value, index)
+
+			return input
+
+		def coefficients(self):
+
+			if HyperComplex.storage == "array":
+
+				return tuple(self.array.tolist())
+
+			return self.a.coefficients() + self.b.coefficients()
+
+		def zero(self):
+
+			if HyperComplex.storage == "array":
+
+				return HyperComplex.fromarray(st.zeros(self.dimensions, HyperComplex.base(), HyperComplex.dtype))
+
+			if isinstance(self.a, Number):
+
+				return HyperComplex(0, 0)
+
+			else:
+
+				return HyperComplex(self.a.zero(), self.b.zero())
+
+		def __init__(self, *args):
+
+			# Added list/tuple type as allowed arguments
+			# Remove need for pair=True
+
+			if len(args) == 2 and HyperComplex.storage == "tree":
+
+				self.a, self.b = map(parent, args)
+
+			elif len(args) == 1 and isinstance(args[0], HyperComplex) and HyperComplex.storage == "array":
+
+				self.array = args[0].array.copy()
+
+			elif len(args) == 1 and isinstance(args[0], HyperComplex.scalars) and HyperComplex.storage == "array":
+
+				self.array = st.zeros(len(self), HyperComplex.base(), HyperComplex.dtype)
+				self.array[0] = HyperComplex.scalar(args[0])
+
+			elif len(args) == 1 and getattr(args[0], "storage", None) == "array" and HyperComplex.storage == "array" and len(args[0]) < len(self):
+
+				self.array = st.zeros(len(self), HyperComplex.base(), HyperComplex.dtype)
+				self.array[:len(args[0])] = st.typed(args[0].array, HyperComplex.base(), HyperComplex.dtype)
+
+			elif len(args) == 0 and HyperComplex.storage == "array":
+
+				self.array = st.zeros(len(self), HyperComplex.base(), HyperComplex.dtype)
+
+			else:
+
+				if len(args) == 2:
+
+					args = parent(args[0]).coefficients() + parent(args[1]).coefficients()
+
+				elif len(args) == 1:
+
+					if hasattr(args[0], "coefficients"):
+
+						args = args[0].coefficients()
+
+					elif isinstance(args[0], complex) and not issubclass(HyperComplex.base(), complex):
+
+						args = args[0].real, args[0].imag
+
+					elif type(args[0]) is tuple:
+
+						args = args[0]
+
+					elif type(args[0]) is list:
+
+						args = tuple(args[0])
+
+					elif isinstance(args[0], np.ndarray):
+
+						args = tuple(args[0].tolist())
+
+				if len(args) > len(self):
+
+					la = len(args)
+					ls = len(self)
+
+					raise TypeError(F"Too many args. Got {la} expecting at most {ls}.")
+
+				if len(self) != len(args):
+
+					args += (HyperComplex.base()(),) * (len(self) - len(args))
+
+				if HyperComplex.storage == "array":
+
+					# numpy would read None as nan, so anything that is not a number is
+					# rejected here as converting it to the base type would be
+
+					if not all(isinstance(x, Number) for x in args):
+
+						raise TypeError("The coefficients must be numbers.")
+
+					self.array = st.typed(args, HyperComplex.base(), HyperComplex.dtype)
+
+				else:
+
+					self.a = parent(*args[:len(self) // 2])
+					self.b = parent(*args[len(self) // 2:])
+
+		def __hash__(self):
+
+			return hash(self.coefficients())
+
+		def __array_ufunc__(self, function, method, *inputs, **options):
+
+			return ufunc(function, method, *inputs, **options)
+
+		def __iter__(self):
+
+			if HyperComplex.storage == "array" or isinstance(self.a, Number):
+
+				yield self.a
+				yield self.b
+
+				return
+
+			for i in self.a:
+
+				yield i
+
+			for i in self.b:
+
+				yield i
+
+		# HyperComplex Products Display
+
+		# HyperComplex.outerproduct()    returns tensor outer product of AB'
+		# HyperCompex.innerproctuct()    returns scalar inner product of A'B
+		# HyperCompex.hadamardproctuct() returns vector hadamard product of AB
+		# HyperCompex.matrix()           returns multiplication matrix
+
+		def matrixdisplay(self, result, **args):
+
+			asstring = option("asstring", False, **args)
+			asobject = option("asobject", False, **args)
+			astuple = option("astuple", False, **args)
+			aslist = option("aslist", False, **args)
+
+			if asstring and not (asobject | astuple | aslist):
+
+				return fm.formatter(HyperComplex, **args).display(result)
+
+			return result
+
+		def outerproduct(self, other, **args):
+
+			# Computed as a numeric outer product of the coefficients, cell (i, j)
+			# holding the coefficient of e[index[i, j]], asarray returns it as is
+			# otherwise each cell is formatted as the named product
+
+			asindex = option("asindex", False, **args)
+			asstring = option("asstring", False, **args)
+			asobject = option("asobject", False, **args)
+			astuple = option("astuple", False, **args)
+			aslist = option("aslist", False, **args)
+			asarray = option("asarray", False, **args)
+
+			other = HyperComplex.coerce(other)
+
+			if other is None:
+
+				return NotImplemented
+
+			values = st.outer(self.coefficients(), other.conjugate().coefficients())
+
+			if asarray:
+
+				return values
+
+			index, _ = HyperComplex.table()
+			formatter = fm.formatter(HyperComplex, **args)
+			size = self.dimensions
+			base = self.base()
+
+			if asindex:
+
+				result = formatter.indexed(values, index)
+
+			elif asstring and not (asobject | astuple | aslist):
+
+				result = [formatter.labels(*row) for row in zip(values.tolist(), index.tolist())]
+
+			else:
+
+				result = [[0] * size for _ in range(size)]
+
+				for i, j in zip(*np.nonzero(values)):
+
+					coefficients = [base(0)] * size
+					coefficients[index[i, j]] = base(values[i, j])
+
+					result[i][j] = HyperComplex(*coefficients)
+
+			if asobject | astuple | aslist:
+
+				for i, j in np.ndindex(size, size):
+
+					temp = result[i][j]
+					temp = temp.astuple() if astuple else temp
+					temp = temp.asobject() if asobject else temp
+					temp = temp.aslist() if aslist else temp
+
+					result[i][j] = temp
+
+			result = self.matrixdisplay(result, **args)
+
+			return result
+
+		def innerproduct(self, other):
+
+			return (self.conjugate() * other).real
+
+		def hadamardproduct(self, other, **args):
+
+			asindex = option("asindex", False, **args)
+			asstring = option("asstring", False, **args)
+			asobject = option("asobject", False, **args)
+			astuple = option("astuple", False, **args)
+			aslist = option("aslist", False, **args)
+			asarray = option("asarray", False, **args)
+
+			other = HyperComplex.coerce(other)
+			base = self.base()
+
+			if other is None:
+
+				return NotImplemented
+
+			values = st.hadamard(self.coefficients(), other.coefficients())
+
+			if asarray:
+
+				return values
+
+			formatter = fm.formatter(HyperComplex, **args)
+			values = values.tolist()
+
+			if asindex:
+
+				result = [-(i + 1) if value < 0 else i + 1 for i, value in enumerate(values)]
+
+			elif asstring and not (asobject | astuple | aslist):
+
+				result = [formatter.label(value, i) for i, value in enumerate(values)]
+
+			else:
+
+				result = list(map(base, values))
+
+			if asobject | astuple | aslist:
+
+				result = HyperComplex(result)
+
+				result = result.astuple() if astuple else result
+				result = result.asobject() if asobject else result
+				result = result.aslist() if aslist else result
+
+			result = self.matrixdisplay(result, **args)
+
+			return result
+
+		def matrix(self, **args):
+
+			# Derived from the cached multiplication table, e[i] * e[j] = sign * e[index],
+			# so no products are computed, only the requested outputs are built
+
+			asindex = option("asindex", False, **args)
+			asstring = option("asstring", False, **args)
+			asobject = option("asobject", False, **args)
+			astuple = option("astuple", False, **args)
+			aslist = option("aslist", False, **args)
+
+			index, sign = HyperComplex.table()
+			formatter = fm.formatter(HyperComplex, **args)
+			size = self.dimensions
+
+			if asstring and not (asobject | astuple | aslist):
+
+				return formatter.grid(index, sign, asindex)
+
+			if asindex:
+
+				result = formatter.table(index, sign, asindex=True)
+
+			else:
+
+				base = self.base()
+				units = [[base(x) if k == i else base(0) for k in range(size)] for i in range(size) for x in (-1, 1)]
+				basis = [HyperComplex(*unit) for unit in units]
+
+				result = [[basis[2 * k + (s > 0)].copy() for k, s in zip(*row)] for row in zip(index.tolist(), sign.tolist())]
+
+			if asobject | astuple | aslist:
+
+				for i, j in np.ndindex(size, size):
+
+					temp = result[i][j]
+					temp = temp.astuple() if astuple else temp
+					temp = temp.asobject() if asobject else temp
+					temp = temp.aslist() if aslist else temp
+
+					result[i][j] = temp
+
+			result = self.matrixdisplay(result, **args)
+
+			return result
+
+		# Output Types
+
+		def asobject(self):
+
+			return HyperComplex(self)
+
+		def astuple(self):
+
+			return tuple(self.coefficients())
+
+		def asarray(self):
+
+			return np.array(self.coefficients(), dtype=HyperComplex.dtype)
+
+		def aslist(self):
+
+			return list(self.coefficients())
+
+		def asstring(self, **args):
+
+			return fm.formatter(HyperComplex, **args).join(self.coefficients())
+
+		# HyperComplex Comparison
+
+		def __eq__(self, other):
+
+			other = HyperComplex.coerce(other)
+
+			if other is None:
+
+				return NotImplemented
+
+			if HyperComplex.storage == "array":
+
+				return bool(np.array_equal(self.array, other.array))
+
+			return self.a == other.a and self.b == other.b
+
+		def __ne__(self, other):
+
+			return not self == other
+
+		def isclose(self, other, **args):
+
+			# Equality within a tolerance, relative to the other value and
+			# absolute near zero. == stays exact so it agrees with __hash__
+
+			tolerance = option("tolerance", HyperComplex.tolerance or 1e-9, **args)
+			other = HyperComplex.coerce(other)
+
+			if other is None:
+
+				raise TypeError(F"Cannot compare {type(self).__name__} with {type(other).__name__}")
+
+			tolerance = abs(HyperComplex.base()(tolerance))
+
+			return all(abs(x - y) <= tolerance * (1 + abs(y)) for x, y in zip(self.coefficients(), other.coefficients()))
+
+		def __lt__(self, other):
+
+			other = HyperComplex.coerce(other)
+
+			if other is None:
+
+				return NotImplemented
+
+			return self.square() < other.square()
+
+		def __le__(self, other):
+
+			return self < other or self == other
+
+		def __gt__(self, other):
+
+			other = HyperComplex.coerce(other)
+
+			if other is None:
+
+				return NotImplemented
+
+			return self.square() > other.square()
+
+		def __ge__(self, other):
+
+			return self > other or self == other
+
+		# Mathematical Conversion
+
+		def convert(self, ctype, dimensions=1):
+
+			coefficients = self.coefficients()
+
+			if any(coefficients[dimensions:]):
+
+				size = self.dimensions
+				classname = self.__class__.__name__
+				typename = ctype.__name__
+
+				raise TypeError(F"Error converting {classname}[{size}] to {typename}: There are non-zero incompatible coefficients.")
 
 			return ctype(*coefficients[:dimensions])
 
 		def __bool__(self):
 
+			if HyperComplex.storage == "array":
+
+				return bool(self.array.any())
+
 			return bool(self.a) or bool(self.b)
 
 		def __int__(self):
@@ -567,88 +1611,450 @@ def cayley_dickson_construction(parent):
 
 		def conjugate(self):
 
+			if HyperComplex.kernel is not None:
+
+				return HyperComplex.fromkernel(HyperComplex.kernel.conjugate(self.coefficients()))
+
+			if HyperComplex.storage == "array":
+
+				result = -self.array
+				result[0] = self.array[0]
+
+				return HyperComplex.fromarray(result)
+
 			return HyperComplex(self.a.conjugate(), -self.b)
 
+		def square(self):
+
+			if HyperComplex.kernel is not None:
+
+				return HyperComplex.base()(HyperComplex.kernel.square(self.coefficients()))
+
+			if HyperComplex.storage == "array":
+
+				return HyperComplex.base()(st.square(self.array))
+
+			return BaseNumber.square(self)
+
+		def inverse(self):
+
+			if HyperComplex.kernel is not None:
+
+				return HyperComplex.fromkernel(HyperComplex.kernel.inverse(self.coefficients()))
+
+			if HyperComplex.storage == "array":
+
+				if not self:
+
+					raise ZeroDivisionError("float division by zero")
+
+				return HyperComplex.fromarray(st.inverse(self.array))
+
+			return BaseNumber.inverse(self)
+
+		# HyperComplex.exp(), log(), sqrt(), sin(), cos() use the polar form of the value
+		# HyperComplex.slerp(other, t) returns the spherical interpolation towards other
+
+		def exp(self):
+
+			return HyperComplex(st.exp(self.asarray()))
+
+		def log(self):
+
+			if not self:
+
+				raise ValueError("The logarithm of zero is undefined.")
+
+			return HyperComplex(st.log(self.asarray()))
+
+		def sqrt(self):
+
+			return HyperComplex(st.sqrt(self.asarray()))
+
+		def sin(self):
+
+			return HyperComplex(st.sin(self.asarray()))
+
+		def cos(self):
+
+			return HyperComplex(st.cos(self.asarray()))
+
+		def slerp(self, other, t):
+
+			other = HyperComplex.coerce(other)
+
+			if other is None:
+
+				return NotImplemented
+
+			result = st.slerp(self.asarray(), other.asarray(), t)
+
+			if np.ndim(t):
+
+				return HyperComplex.Array(result)
+
+			return HyperComplex(result)
+
 		def __neg__(self):
 
+			if HyperComplex.storage == "array":
+
+				return HyperComplex.fromarray(-self.array)
+
 			return HyperComplex(-self.a, -self.b)
 
 		def __pos__(self):
 
+			if HyperComplex.storage == "array":
+
+				return HyperComplex.fromarray(+self.array)
+
 			return HyperComplex(+self.a, +self.b)
 
 		def __add__(self, other):
 
+			if HyperComplex.storage == "array" and isinstance(other, HyperComplex.scalars):
+
+				other = HyperComplex.scalar(other)
+				result = self.array.copy()
+				result[0] += other
+
+				return HyperComplex.fromarray(result)
+
 			other = HyperComplex.coerce(other)
 
 			if other is None:
 
 				return NotImplemented
 
+			if HyperComplex.storage == "array":
+
+				return HyperComplex.fromarray(self.array + other.array)
+
 			return HyperComplex(self.a + other.a, self.b + other.b)
 
 		def __radd__(self, other):
 
+			if HyperComplex.storage == "array" and isinstance(other, HyperComplex.scalars):
+
+				return self + other
+
 			return HyperComplex(other) + self
 
 		def __sub__(self, other):
 
+			if HyperComplex.storage == "array" and isinstance(other, HyperComplex.scalars):
+
+				other = HyperComplex.scalar(other)
+				result = self.array.copy()
+				result[0] -= other
+
+				return HyperComplex.fromarray(result)
+
 			other = HyperComplex.coerce(other)
 
 			if other is None:
 
 				return NotImplemented
 
+			if HyperComplex.storage == "array":
+
+				return HyperComplex.fromarray(self.array - other.array)
+
 			return HyperComplex(self.a - other.a, self.b - other.b)
 
 		def __rsub__(self, other):
 
+			if HyperComplex.storage == "array" and isinstance(other, HyperComplex.scalars):
+
+				other = HyperComplex.scalar(other)
+				result = -self.array
+				result[0] += other
+
+				return HyperComplex.fromarray(result)
+
 			return HyperComplex(other) - self
 
-		@lru_cache(maxsize=128)
-		def __pow__(self, power):
+		# In Place Operations
+		# Array stored values are updated in their existing storage, while tree
+		# stored values fall back to the normal operators and are rebound
 
-			if not isinstance(power, int):
+		def __iadd__(self, other):
+
+			if HyperComplex.storage != "array":
 
 				return NotImplemented
 
-			base = HyperComplex.base()
-			value = HyperComplex(base(1))
+			if isinstance(other, HyperComplex.scalars):
+
+				other = HyperComplex.scalar(other)
+				self.array[0] += other
+
+				return self
+
+			other = HyperComplex.coerce(other)
+
+			if other is None:
+
+				return NotImplemented
+
+			self.array += other.array
+
+			return self
+
+		def __isub__(self, other):
+
+			if HyperComplex.storage != "array":
+
+				return NotImplemented
+
+			if isinstance(other, HyperComplex.scalars):
+
+				other = HyperComplex.scalar(other)
+				self.array[0] -= other
+
+				return self
+
+			other = HyperComplex.coerce(other)
+
+			if other is None:
+
+				return NotImplemented
+
+			self.array -= other.array
+
+			return self
+
+		def __imul__(self, other):
+
+			if HyperComplex.storage != "array":
+
+				return NotImplemented
+
+			if isinstance(other, HyperComplex.scalars):
 
-			if power:
+				other = HyperComplex.scalar(other)
+				self.array *= other
 
-				multiplier = self if power > 0 else self.inverse()
+				return self
 
-				for _ in range(abs(power)):
+			other = HyperComplex.coerce(other)
+
+			if other is None:
+
+				return NotImplemented
+
+			st.multiply(self.array, other.array, out=self.array)
+
+			return self
+
+		def __itruediv__(self, other):
+
+			if HyperComplex.storage != "array":
+
+				return NotImplemented
+
+			if isinstance(other, HyperComplex.scalars):
+
+				other = HyperComplex.scalar(other)
+
+				if not other:
+
+					raise ZeroDivisionError("float division by zero")
+
+				self.array /= other
+
+				return self
+
+			other = HyperComplex.coerce(other)
+
+			if other is None:
+
+				return NotImplemented
+
+			if not other:
+
+				raise ZeroDivisionError("float division by zero")
+
+			st.divide(self.array, other.array, out=self.array)
+
+			return self
+
+		# HyperComplex.add_into(out, x, y) writes x + y into the storage of out
+		# HyperComplex.sub_into(out, x, y) writes x - y into the storage of out
+		# HyperComplex.mul_into(out, x, y) writes x * y into the storage of out
+		# HyperComplex.div_into(out, x, y) writes x / y into the storage of out
+
+		@staticmethod
+		def operands(out, x, y):
+
+			if HyperComplex.storage != "array" or not isinstance(out, HyperComplex):
+
+				raise TypeError("The output must be an array stored value of the same algebra.")
+
+			x = HyperComplex.coerce(x)
+			y = HyperComplex.scalar(y) if isinstance(y, HyperComplex.scalars) else HyperComplex.coerce(y)
+
+			if x is None or y is None:
+
+				raise TypeError("The inputs must be compatible with the output algebra.")
+
+			return x.array, y if isinstance(y, HyperComplex.scalars) else y.array
+
+		@staticmethod
+		def add_into(out, x, y):
+
+			x, y = HyperComplex.operands(out, x, y)
+
+			if isinstance(y, HyperComplex.scalars):
+
+				out.array[...] = x
+				out.array[0] += y
+
+			else:
+
+				np.add(x, y, out=out.array)
+
+			return out
+
+		@staticmethod
+		def sub_into(out, x, y):
+
+			x, y = HyperComplex.operands(out, x, y)
+
+			if isinstance(y, HyperComplex.scalars):
+
+				out.array[...] = x
+				out.array[0] -= y
+
+			else:
+
+				np.subtract(x, y, out=out.array)
+
+			return out
+
+		@staticmethod
+		def mul_into(out, x, y):
+
+			x, y = HyperComplex.operands(out, x, y)
+
+			if isinstance(y, HyperComplex.scalars):
+
+				np.multiply(x, y, out=out.array)
+
+			else:
+
+				st.multiply(x, y, out=out.array)
+
+			return out
+
+		@staticmethod
+		def div_into(out, x, y):
+
+			x, y = HyperComplex.operands(out, x, y)
+
+			if not np.any(y):
+
+				raise ZeroDivisionError("float division by zero")
+
+			if isinstance(y, HyperComplex.scalars):
+
+				np.divide(x, y, out=out.array)
+
+			else:
+
+				st.divide(x, y, out=out.array)
+
+			return out
+
+		@cc.memoize
+		def __pow__(self, power):
+
+			# Integer powers use repeated squaring, which is exact and valid as all
+			# Cayley-Dickson algebras are power-associative, other real powers use
+			# the polar form r ** p * (cos(p * t) + u * sin(p * t))
+
+			if isinstance(power, (int, np.integer)):
+
+				base = HyperComplex.base()
+				value = HyperComplex(base(1))
+				multiplier = self if power >= 0 else self.inverse()
+				power = abs(int(power))
+
+				while power:
 
-					value *= multiplier
+					if power & 1:
 
-			return value
+						value = value * multiplier
 
-		@lru_cache(maxsize=128)
+					power >>= 1
+
+					if power:
+
+						multiplier = multiplier * multiplier
+
+				return value
+
+			if isinstance(power, RealNumber):
+
+				if not self and power < 0:
+
+					raise ZeroDivisionError("Zero cannot be raised to a negative power.")
+
+				return HyperComplex(st.power(np.array(self.coefficients(), dtype=np.float64), float(power)))
+
+			return NotImplemented
+
+		@cc.memoize
 		def __mul__(self, other):
 
+			if HyperComplex.storage == "array" and isinstance(other, HyperComplex.scalars):
+
+				return HyperComplex.fromarray(self.array * HyperComplex.scalar(other))
+
 			other = HyperComplex.coerce(other)
 
 			if other is None:
 
 				return NotImplemented
 
+			if HyperComplex.kernel is not None:
+
+				return HyperComplex.fromkernel(HyperComplex.kernel.multiply(self.coefficients(), other.coefficients()))
+
+			if HyperComplex.storage == "array":
+
+				return HyperComplex.fromarray(st.multiply(self.array, other.array))
+
 			a = self.a * other.a - other.b.conjugate() * self.b
 			b = other.b * self.a + self.b * other.a.conjugate()
 
 			return HyperComplex(a, b)
 
-		@lru_cache(maxsize=128)
+		@cc.memoize
 		def __rmul__(self, other):
 
+			if HyperComplex.storage == "array" and isinstance(other, HyperComplex.scalars):
+
+				return HyperComplex.fromarray(HyperComplex.scalar(other) * self.array)
+
 			return HyperComplex(other) * self
 
-		@lru_cache(maxsize=128)
+		@cc.memoize
 		def __truediv__(self, other):
 
 			base = HyperComplex.base()
 
+			if HyperComplex.storage == "array" and isinstance(other, HyperComplex.scalars):
+
+				other = HyperComplex.scalar(other)
+
+				if not other:
+
+					raise ZeroDivisionError("float division by zero")
+
+				return HyperComplex.fromarray(self.array / other)
+
 			if isinstance(other, base):
 
 				other = base(1) / other
@@ -665,14 +2071,35 @@ def cayley_dickson_construction(parent):
 
 			return self * other
 
-		@lru_cache(maxsize=128)
+		@cc.memoize
 		def __rtruediv__(self, other):
 
 			return HyperComplex(other) / self
 
+	class Array(HyperComplexArray):
+
+		__slots__ = ()
+
+		algebra = HyperComplex
+		dimensions = HyperComplex.dimensions
+		order = HyperComplex.order
+
+	HyperComplex.storage = storage
+	HyperComplex.dtype = dtype
+	HyperComplex.tolerance = st.tolerance(dtype)
+
+	# Scalars scale every coefficient (or add to the real part), with a complex
+	# base complex numbers are scalars too rather than the first two coefficients
+
+	HyperComplex.scalars = (RealNumber, complex) if issubclass(HyperComplex.base(), complex) else (RealNumber,)
+	HyperComplex.kernel = kernel
+	HyperComplex.Array = Array
+
+	registry[key] = HyperComplex
+
 	return HyperComplex
 
-def cayley_dickson_algebra(level, base=float):
+def cayley_dickson_algebra(level, base=float, storage=None, unrolled=False, dtype=None):
 
 	if not isinstance(level, int) or level < 0:
 
@@ -682,7 +2109,7 @@ def cayley_dickson_algebra(level, base=float):
 
 	for _ in range(level):
 
-		numbers = cayley_dickson_construction(numbers)
+		numbers = cayley_dickson_construction(numbers, storage, unrolled, dtype)
 
 	return numbers
 
@@ -690,36 +2117,48 @@ def debug(*values):
 
 	print(*values, sep="\n", end="\n\n")
 
-Real       = R = cayley_dickson_real_base()
-Complex    = C = cayley_dickson_construction(R)
-Quaternion = H = cayley_dickson_construction(C)
-Octonion   = O = cayley_dickson_construction(H)
-Sedenion   = S = cayley_dickson_construction(O)
-Pathion    = P = cayley_dickson_construction(S)
-Chingon    = X = cayley_dickson_construction(P)
-Routon     = U = cayley_dickson_construction(X)
-Voudon     = V = cayley_dickson_construction(U)
-
-Order = {
-	0: Real(),
-	1: Complex(),
-	2: Quaternion(),
-	3: Octonion(),
-	4: Sedenion(),
-	5: Pathion(),
-	6: Chingon(),
-	7: Routon(),
-	8: Voudon()
-}
+# Named Algebras
+# Real (R) through Voudon (V) are built on first access, E.g. hypercomplex.H,
+# from hypercomplex import Quaternion, Order[2] or Names["Quaternion"]
+
+named = ("Real", "Complex", "Quaternion", "Octonion", "Sedenion", "Pathion", "Chingon", "Routon", "Voudon")
+symbols = ("R", "C", "H", "O", "S", "P", "X", "U", "V")
+levels = {**{name: level for level, name in enumerate(named)}, **{name: level for level, name in enumerate(symbols)}}
+
+def __getattr__(name):
+
+	if name not in levels:
+
+		raise AttributeError(F"module {__name__!r} has no attribute {name!r}")
+
+	globals()[name] = cayley_dickson_algebra(levels[name])
+
+	return globals()[name]
+
+class Instances(Mapping):
+
+	# Read only mapping of keys to zero valued instances of each algebra,
+	# an algebra is only built when its key is first looked up, and every
+	# lookup is a new instance, so updating one in place (x += 5) cannot
+	# change the value other callers get
+
+	def __init__(self, keys):
+
+		self.levels = keys
+
+	def __getitem__(self, key):
+
+		return cayley_dickson_algebra(self.levels[key])()
+
+	def __iter__(self):
+
+		return iter(self.levels)
+
+	def __len__(self):
+
+		return len(self.levels)
+
+Order = Instances({level: level for level in range(len(named))})
+Names = Instances({name: level for level, name in enumerate(named)})
 
-Names = {
-	"Real": Real(),
-	"Complex": Complex(),
-	"Quaternion": Quaternion(),
-	"Octonion": Octonion(),
-	"Sedenion": Sedenion(),
-	"Pathion": Pathion(),
-	"Chingon": Chingon(),
-	"Routon": Routon(),
-	"Voudon": Voudon()
-}
\ No newline at end of file
+__all__ = [name for name in globals() if not name.startswith("_")] + list(levels)
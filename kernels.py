@@ -0,0 +1,110 @@
+from functools import lru_cache
+
+import importlib.util as iu
+import os
+import re
+import structure as st
+
+# Unrolled Kernels
+# Straight line Python functions generated from the multiplication table of an
+# order, working on sequences of coefficients and returning tuples, so each
+# product is a single call with no recursion, temporaries or array overhead
+
+# Generated modules are written to the cache directory (HYPERCOMPLEX_CACHE or
+# ~/.cache/hypercomplex) keyed by order and base type, so Python compiles them
+# once and later processes load the bytecode from __pycache__
+
+version = 1
+directory = os.environ.get("HYPERCOMPLEX_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "hypercomplex"))
+
+def variables(name, size):
+
+	return ", ".join(F"{name}{i}" for i in range(size)) + ("," if size == 1 else "")
+
+def source(order, base=float):
+
+	index, sign = st.table(order)
+
+	size = len(index)
+	name = F"{base.__module__}.{base.__qualname__}"
+	unpack = F"\t{variables('x', size)} = x\n"
+	squares = " + ".join(F"x{i} * x{i}" for i in range(size))
+	products = []
+
+	for k in range(size):
+
+		terms = ""
+
+		for i, j in zip(*((index == k).nonzero())):
+
+			operator = "+" if sign[i, j] > 0 else "-"
+			terms += F" {operator} x{i} * y{j}"
+
+		terms = terms[3:] if terms[1] == "+" else "-" + terms[3:]
+		products.append(F"\t\t{terms},\n")
+
+	conjugates = ", ".join(["x0"] + [F"-x{i}" for i in range(1, size)] + [""] * (size == 1))
+	inverses = ", ".join(["x0 / s"] + [F"-x{i} / s" for i in range(1, size)] + [""] * (size == 1))
+
+	return (
+		F"# Generated by kernels.py (version {version}) for order {order} with base {name}, do not edit\n\n"
+		F"def multiply(x, y):\n\n{unpack}\t{variables('y', size)} = y\n\n\treturn (\n{''.join(products)}\t)\n\n"
+		F"def conjugate(x):\n\n{unpack}\n\treturn ({conjugates})\n\n"
+		F"def square(x):\n\n{unpack}\n\treturn {squares}\n\n"
+		F"def inverse(x):\n\n{unpack}\ts = {squares}\n\n\treturn ({inverses})\n"
+	)
+
+def filename(order, base=float):
+
+	name = re.sub(r"\W+", "_", F"{base.__module__}_{base.__qualname__}")
+
+	return os.path.join(directory, F"kernels_v{version}_order{order}_{name}.py")
+
+@lru_cache(maxsize=None)
+def load(order, base=float):
+
+	path = filename(order, base)
+	code = source(order, base)
+
+	try:
+
+		# A missing, stale or damaged file (different from the source built
+		# above) is written again before it is loaded
+
+		try:
+
+			with open(path) as file:
+
+				current = file.read()
+
+		except (OSError, UnicodeDecodeError):
+
+			current = None
+
+		if current != code:
+
+			os.makedirs(directory, exist_ok=True)
+
+			temporary = F"{path}.{os.getpid()}.tmp"
+
+			with open(temporary, "w") as file:
+
+				file.write(code)
+
+			os.replace(temporary, path)
+
+		spec = iu.spec_from_file_location(os.path.basename(path)[:-3], path)
+		module = iu.module_from_spec(spec)
+		spec.loader.exec_module(module)
+
+		return module
+
+	except (OSError, SyntaxError):
+
+		# Read only or missing cache directory, or a file changed while it was
+		# loaded, compile in memory instead
+
+		module = iu.module_from_spec(iu.spec_from_loader(F"kernels_order{order}", loader=None))
+		exec(compile(code, path, "exec"), module.__dict__)
+
+		return module
@@ -1,15 +1,17 @@
-from hypercomplex import Order, Names
+from hypercomplex import cayley_dickson_algebra, Order, Names
 
 import argparse as ap
-import matplotlib as mpl
-import matplotlib.pyplot as plt
-import seaborn as sea
 import numpy as np
 
 # Color Maps: https://matplotlib.org/stable/tutorials/colors/colormaps.html
 
 def plot(**options):
 
+	# Plotting libraries are only imported when a plot is drawn
+
+	import matplotlib.pyplot as plt
+	import seaborn as sea
+
 	def option(name, default, **options):
 
 		if name in options:
@@ -35,36 +37,40 @@ def plot(**options):
 
 		self = Names.get(named, None)
 
-	elif order != None:
+	elif order in Order:
+
+		self = Order[order]
+
+	elif isinstance(order, int) and order >= 0:
 
-		self = Order.get(order, None)
+		self = cayley_dickson_algebra(order)()
 
 	else:
 
 		self = None
 
-	if self == None or (hasattr(self, "order") and self.order > 8):
+	if self == None:
 
 		raise NotImplementedError
 
 	sea.set_style("white")
 
+	# The table is drawn as one image, each cell colored by looking up its
+	# signed index in the palettes, rather than one patch per cell
+
 	size = self.dimensions
-	matrix = self.matrix(asindex=True)
+	index, sign = self.table()
+	matrix = (index + 1) * sign
 	figure, axis = plt.subplots(figsize=(figsize, figsize), dpi=figdpis)
 	numcolors = 2 * size + 1 if diverge else size
-	positives = sea.color_palette(poscmap, numcolors)
-	negatives = sea.color_palette(negcmap, numcolors)
-	rectangle = mpl.patches.Rectangle
-	extras = dict(snap=False, lw=1, zorder=1)
-
-	for (x, y), value in np.ndenumerate(matrix):
-
-		location = (y, size - x - 1)
-		value = value + size if diverge else abs(value) - 1
-		color = negatives[value] if showneg and not diverge and value < 0 else positives[value]
-		patch = rectangle(location, 1, 1, edgecolor=color, facecolor=color, **extras)
-		axis.add_patch(patch)
+	positives = np.array(sea.color_palette(poscmap, numcolors))
+	negatives = np.array(sea.color_palette(negcmap, numcolors))
+
+	values = matrix + size if diverge else np.abs(matrix) - 1
+	negative = (showneg and not diverge) & (values < 0)
+	image = np.where(negative[..., None], negatives[values], positives[values])
+
+	axis.imshow(image, extent=(0, size, 0, size), origin="upper", interpolation="nearest", zorder=1)
 
 	axis.get_xaxis().set_ticks([])
 	axis.get_yaxis().set_ticks([])
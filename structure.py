@@ -0,0 +1,518 @@
+from fractions import Fraction
+from functools import lru_cache
+
+import math
+import numpy as np
+import os
+
+# Structure Constants (Cayley-Dickson Multiplication Tables)
+# e[i] * e[j] = sign[i, j] * e[index[i, j]]
+
+# Each level is built from the previous one using the Cayley-Dickson formula
+# (a, b) * (c, d) = (a * c - conj(d) * b, d * a + b * conj(c)), applied to the
+# four blocks of basis elements (e, 0) and (0, e), so only the parent table is
+# needed and no hypercomplex objects are created.
+
+# Table Cache
+# Tables from order minimum upwards are saved as .npy files in the cache
+# directory (HYPERCOMPLEX_CACHE or ~/.cache/hypercomplex) keyed by variant and
+# order, and loaded memory mapped read only, so every process shares one page
+# cached copy. Smaller tables are quicker to build than to read from disk.
+
+version = 1
+minimum = 6
+directory = os.environ.get("HYPERCOMPLEX_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "hypercomplex"))
+
+def filenames(variant, order, names):
+
+	return [os.path.join(directory, F"{variant}_v{version}_order{order}_{name}.npy") for name in names]
+
+def stored(variant, order, names, function):
+
+	if order < minimum:
+
+		return function()
+
+	paths = filenames(variant, order, names)
+	arrays = None
+
+	try:
+
+		if not all(os.path.exists(path) for path in paths):
+
+			arrays = function()
+			os.makedirs(directory, exist_ok=True)
+
+			for path, array in zip(paths, arrays):
+
+				temporary = F"{path}.{os.getpid()}.tmp"
+
+				with open(temporary, "wb") as file:
+
+					np.save(file, array)
+
+				os.replace(temporary, path)
+
+		return tuple(np.load(path, mmap_mode="r") for path in paths)
+
+	except (OSError, ValueError):
+
+		# Read only cache directory or damaged files, use the tables in memory
+
+		return arrays if arrays != None else function()
+
+@lru_cache(maxsize=None)
+def table(order):
+
+	if not isinstance(order, int) or order < 0:
+
+		raise ValueError("The order must be a positive integer.")
+
+	return stored("table", order, ("index", "sign"), lambda: buildtable(order))
+
+def buildtable(order):
+
+	if order == 0:
+
+		return np.zeros((1, 1), dtype=np.intp), np.ones((1, 1), dtype=np.int8)
+
+	parent_index, parent_sign = table(order - 1)
+
+	half = 2 ** (order - 1)
+	size = half * 2
+	conjugate = np.full(half, -1, dtype=np.int8)
+	conjugate[0] = 1
+
+	index = np.empty((size, size), dtype=np.intp)
+	sign = np.empty((size, size), dtype=np.int8)
+
+	index[:half, :half] = parent_index
+	index[:half, half:] = parent_index.T + half
+	index[half:, :half] = parent_index + half
+	index[half:, half:] = parent_index.T
+
+	sign[:half, :half] = parent_sign
+	sign[:half, half:] = parent_sign.T
+	sign[half:, :half] = parent_sign * conjugate
+	sign[half:, half:] = -parent_sign.T * conjugate
+
+	index.flags.writeable = False
+	sign.flags.writeable = False
+
+	return index, sign
+
+# Gather Tables (Table Transposed For Products)
+# (x * y)[k] = sum(x[gather[k, j]] * sign[k, j] * y[j] for j)
+
+# Every row and column of the index table is a permutation, so for each
+# output coefficient k and right hand coefficient j there is exactly one
+# left hand coefficient i contributing to it.
+
+@lru_cache(maxsize=None)
+def gathered(order):
+
+	return stored("gathered", order, ("gather", "signs"), lambda: buildgathered(order))
+
+def buildgathered(order):
+
+	index, sign = table(order)
+
+	size = len(index)
+	rows = np.arange(size)
+	gather = np.empty((size, size), dtype=np.intp)
+	signs = np.empty((size, size), dtype=np.int8)
+
+	gather[index, rows[None, :]] = rows[:, None]
+	signs[index, rows[None, :]] = sign
+
+	gather.flags.writeable = False
+	signs.flags.writeable = False
+
+	return gather, signs
+
+# Coefficient Types
+# Float bases are stored in float64 arrays, any other base (int, Fraction,
+# Decimal) in object arrays holding values of that base, which the same table
+# operations below work on exactly, as numpy calls the base type's operators
+
+def datatype(base=float):
+
+	return np.dtype(np.float64 if issubclass(base, float) else object)
+
+def zeros(shape, base=float, dtype=None):
+
+	dtype = datatype(base) if dtype is None else np.dtype(dtype)
+
+	if dtype == object:
+
+		return np.full(shape, base(0), dtype=object)
+
+	return np.zeros(shape, dtype=dtype)
+
+def scalar(value, base=float, dtype=None):
+
+	# Scalars mixed into object arrays are converted to the base type first, so
+	# a float or numpy operand does not leave floats in a Fraction or Decimal
+	# number, numeric arrays cast them themselves
+
+	dtype = datatype(base) if dtype is None else np.dtype(dtype)
+
+	if dtype != object:
+
+		return value
+
+	if isinstance(value, np.generic):
+
+		value = value.item()
+
+	return value if type(value) is base else base(value)
+
+def typed(values, base=float, dtype=None):
+
+	dtype = datatype(base) if dtype is None else np.dtype(dtype)
+
+	if dtype == object:
+
+		convert = np.frompyfunc(lambda value: scalar(value, base, dtype), 1, 1)
+
+		return np.asarray(convert(np.asarray(values, dtype=object)), dtype=object)
+
+	return np.asarray(values, dtype=dtype)
+
+# Tolerances
+# Values stored with less precision than a Python float compare equal within
+# a few units of their resolution, float64 and wider (and exact) types compare
+# exactly, as Python floats do
+
+def tolerance(dtype):
+
+	dtype = np.dtype(dtype)
+
+	if dtype.kind not in "fc" or np.finfo(dtype).resolution <= np.finfo(np.float64).resolution:
+
+		return 0
+
+	return float(np.finfo(dtype).resolution) * 10
+
+# Exact Rationals
+# Fraction arrays are multiplied as integer numerators over one common
+# denominator, so only the results are reduced by gcd rather than every
+# intermediate product and sum
+
+numerator = np.frompyfunc(lambda x: x.numerator, 1, 1)
+denominator = np.frompyfunc(lambda x: x.denominator, 1, 1)
+fraction = np.frompyfunc(Fraction, 2, 1)
+
+def isrational(x):
+
+	return x.dtype == object and x.size > 0 and isinstance(x.flat[0], Fraction)
+
+def rational(x):
+
+	denominators = denominator(x)
+	common = math.lcm(*denominators.flat)
+
+	return numerator(x) * (common // denominators), common
+
+def level(dimensions):
+
+	result = int(dimensions).bit_length() - 1
+
+	if dimensions < 1 or 2 ** result != dimensions:
+
+		raise ValueError(F"Invalid dimensions {dimensions}, expecting a power of two.")
+
+	return result
+
+def unit(dimensions):
+
+	result = np.zeros(dimensions)
+	result[0] = 1
+
+	return result
+
+# Coefficient Array Operations
+# Work on single coefficient vectors (n,) or stacks of them (..., n),
+# with an optional out array to write the result into
+
+def multiply(x, y, out=None):
+
+	# Single vectors use one gather of the left operand and one dot product,
+	# stacks accumulate one column at a time to keep memory at O(N * n)
+
+	x = np.asarray(x)
+	y = np.asarray(y)
+
+	gather, signs = gathered(level(x.shape[-1]))
+
+	if out is not None and (np.shares_memory(out, x) or np.shares_memory(out, y)):
+
+		out[...] = multiply(x, y)
+
+		return out
+
+	if isrational(x) and isrational(y):
+
+		(x, a), (y, b) = rational(x), rational(y)
+
+		result = fraction(multiply(x, y), a * b)
+
+		if out is None:
+
+			return result
+
+		out[...] = result
+
+		return out
+
+	if x.ndim == 1 and y.ndim == 1:
+
+		return np.matmul(x[gather] * signs, y, out=out)
+
+	if out is None:
+
+		out = np.zeros(np.broadcast_shapes(x.shape, y.shape), dtype=np.result_type(x, y))
+
+	else:
+
+		out[...] = 0
+
+	for j in range(len(gather)):
+
+		out += x[..., gather[:, j]] * signs[:, j] * y[..., j, None]
+
+	return out
+
+def conjugate(x, out=None):
+
+	x = np.asarray(x)
+	real = x[..., 0].copy()
+	out = np.negative(x, out=out)
+	out[..., 0] = real
+
+	return out
+
+def square(x):
+
+	return np.einsum("...i,...i->...", x, x)
+
+def norm(x):
+
+	return np.sqrt(square(x))
+
+def normalize(x, out=None):
+
+	return np.divide(x, np.asarray(norm(x))[..., None], out=out)
+
+def inverse(x, out=None):
+
+	scale = np.asarray(square(x))[..., None]
+	out = conjugate(x, out=out)
+	out /= scale
+
+	return out
+
+def divide(x, y, out=None):
+
+	return multiply(x, inverse(y), out=out)
+
+# Coefficient Products
+# outer(x, y)[..., i, j] is the coefficient of e[index[i, j]] in (x[i] e[i]) * (y[j] e[j]),
+# so the cells sharing each index sum to the full product, hadamard is elementwise
+
+def outer(x, y):
+
+	x = np.asarray(x)
+	y = np.asarray(y)
+
+	index, sign = table(level(x.shape[-1]))
+
+	return x[..., :, None] * y[..., None, :] * sign.astype(np.result_type(x, y))
+
+def hadamard(x, y):
+
+	return np.multiply(x, y)
+
+# Polar Form
+# x = r * (cos(t) + u * sin(t)), r the norm, t the angle from the real axis
+# and u the unit imaginary axis, real values use the first imaginary unit
+
+# Floating point arrays keep their type (float32 stays float32), anything
+# else is computed in float64
+
+def floating(x):
+
+	x = np.asarray(x)
+
+	return x if x.dtype.kind == "f" else x.astype(np.float64)
+
+def imaginary(x):
+
+	x = floating(x)
+	size = norm(x[..., 1:])
+	axis = np.zeros_like(x[..., 1:])
+
+	np.divide(x[..., 1:], size[..., None], out=axis, where=size[..., None] > 0)
+	axis[..., 0] = np.where(size > 0, axis[..., 0], 1)
+
+	return size, axis
+
+def polar(x):
+
+	x = floating(x)
+	size, axis = imaginary(x)
+	radius = np.hypot(x[..., 0], size)
+	angle = np.arctan2(size, x[..., 0])
+
+	return radius, angle, axis
+
+def rectangular(radius, angle, axis):
+
+	radius = np.asarray(radius)
+	result = np.empty(axis.shape[:-1] + (axis.shape[-1] + 1,), dtype=np.result_type(radius, axis))
+	result[..., 0] = radius * np.cos(angle)
+	result[..., 1:] = (radius * np.sin(angle))[..., None] * axis
+
+	return result
+
+def power(x, exponent):
+
+	# Integer exponents use repeated squaring, O(log(n)) products, which
+	# stays exact for object arrays, real exponents use the polar form,
+	# O(dimensions)
+
+	if isinstance(exponent, (int, np.integer)):
+
+		x = np.asarray(x) if np.asarray(x).dtype == object else floating(x)
+		result = np.zeros_like(x)
+		result[..., 0] = 1
+		multiplier = x if exponent >= 0 else inverse(x)
+		exponent = abs(int(exponent))
+
+		while exponent:
+
+			if exponent & 1:
+
+				result = multiply(result, multiplier)
+
+			exponent >>= 1
+
+			if exponent:
+
+				multiplier = multiply(multiplier, multiplier)
+
+		return result
+
+	radius, angle, axis = polar(x)
+
+	return rectangular(radius ** exponent, angle * exponent, axis)
+
+# Transcendental Functions
+# Any x = a + v generates a subalgebra isomorphic to the complex numbers, with
+# the unit imaginary axis u = v / |v| taking the place of i, so each function
+# is the complex one applied to (a, |v|) in every power-associative algebra
+
+def exp(x):
+
+	x = floating(x)
+	size, axis = imaginary(x)
+
+	return rectangular(np.exp(x[..., 0]), size, axis)
+
+def log(x):
+
+	radius, angle, axis = polar(x)
+	result = np.empty(axis.shape[:-1] + (axis.shape[-1] + 1,), dtype=axis.dtype)
+	result[..., 0] = np.log(radius)
+	result[..., 1:] = angle[..., None] * axis
+
+	return result
+
+def sqrt(x):
+
+	return power(x, 0.5)
+
+def sin(x):
+
+	x = floating(x)
+	size, axis = imaginary(x)
+	result = np.empty_like(x)
+	result[..., 0] = np.sin(x[..., 0]) * np.cosh(size)
+	result[..., 1:] = (np.cos(x[..., 0]) * np.sinh(size))[..., None] * axis
+
+	return result
+
+def cos(x):
+
+	x = floating(x)
+	size, axis = imaginary(x)
+	result = np.empty_like(x)
+	result[..., 0] = np.cos(x[..., 0]) * np.cosh(size)
+	result[..., 1:] = -(np.sin(x[..., 0]) * np.sinh(size))[..., None] * axis
+
+	return result
+
+# Interpolation
+# slerp follows the great arc between x and y, by default taking the shorter
+# arc so rotation quaternions q and -q are treated as the same orientation
+
+def slerp(x, y, t, shortest=True):
+
+	x = floating(x)
+	y = floating(y)
+	t = np.asarray(t, dtype=np.result_type(x, y))[..., None]
+
+	cosine = np.einsum("...i,...i->...", x, y) / (norm(x) * norm(y))
+
+	if shortest:
+
+		y = np.where(cosine[..., None] < 0, -y, y)
+		cosine = np.abs(cosine)
+
+	omega = np.arccos(np.clip(cosine, -1, 1))[..., None]
+	sine = np.sin(omega)
+	linear = sine < 1e-12
+
+	with np.errstate(divide="ignore", invalid="ignore"):
+
+		a = np.where(linear, 1 - t, np.sin((1 - t) * omega) / sine)
+		b = np.where(linear, t, np.sin(t * omega) / sine)
+
+	return a * x + b * y
+
+def controls(keys):
+
+	# Squad control points s[i] = q[i] * exp(-(log(q[i]' * q[i+1]) + log(q[i]' * q[i-1])) / 4)
+	# for a sequence of keys, after flipping signs so neighbours share a hemisphere
+
+	keys = np.array(floating(keys))
+	flips = np.einsum("...i,...i->...", keys[:-1], keys[1:]) < 0
+	signs = np.cumprod(np.where(flips, -1.0, 1.0))
+	keys[1:] *= signs[:, None]
+
+	result = keys.copy()
+
+	if len(keys) > 2:
+
+		inverses = inverse(keys[1:-1])
+		after = log(multiply(inverses, keys[2:]))
+		before = log(multiply(inverses, keys[:-2]))
+		result[1:-1] = multiply(keys[1:-1], exp(-(after + before) / 4))
+
+	return keys, result
+
+def squad(keys, times):
+
+	# Evaluates the squad spline through keys at times in [0, len(keys) - 1],
+	# where key i is reached at time i
+
+	keys, points = controls(keys)
+	times = np.asarray(times, dtype=np.float64)
+	index = np.clip(np.floor(times).astype(np.intp), 0, max(len(keys) - 2, 0))
+	t = times - index
+	after = np.minimum(index + 1, len(keys) - 1)
+
+	path = slerp(keys[index], keys[after], t, shortest=False)
+	curve = slerp(points[index], points[after], t, shortest=False)
+
+	return slerp(path, curve, 2 * t * (1 - t), shortest=False)